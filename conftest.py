@@ -4,18 +4,18 @@ Contains fixtures, setup/teardown methods, and global test configurations.
 """
 
 import pytest
+import base64
+import logging
 import os
+import queue
+import shutil
+import tempfile
+import threading
 import time
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.safari.service import Service as SafariService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 
+from utils.screenshot_helper import flush_screenshots
+
+log = logging.getLogger(__name__)
 
 # Test Configuration
 TEST_URL = "https://piratesquad.rocks/?campBuilderTest=1&insBuild=MTYwODc=&insVar=YzE3MjU=&routeAlias=custom&queryHash=77e2ecf59905618c6426e9aa8cf7407c47293623d7496e3148944c81aeffce95"
@@ -24,9 +24,58 @@ SCREENSHOT_DIR = "screenshots"
 FAILED_SCREENSHOT_DIR = os.path.join(SCREENSHOT_DIR, "failed")
 PASSED_SCREENSHOT_DIR = os.path.join(SCREENSHOT_DIR, "passed")
 
-# Create screenshot directories
-os.makedirs(FAILED_SCREENSHOT_DIR, exist_ok=True)
-os.makedirs(PASSED_SCREENSHOT_DIR, exist_ok=True)
+# Driver binaries can be pinned via environment variables (e.g. in CI); otherwise
+# webdriver-manager resolves them once and the path is reused
+_CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")
+_GECKODRIVER_PATH = os.environ.get("GECKODRIVER_PATH")
+
+# pytest-xdist worker id ("gw0", "gw1", ...); serial runs behave like worker "gw0"
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+# Screenshots are written by a background thread so the report hook only
+# waits for the browser to return the image bytes, not for the disk
+SCREENSHOT_BATCH_SIZE = 16
+_screenshot_queue = queue.Queue()
+# Screenshot directories are created on first write rather than at import
+_created_screenshot_dirs = set()
+_SCREENSHOT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(path, data):
+    """Write bytes with a single unbuffered fd and no fsync."""
+    fd = os.open(path, _SCREENSHOT_OPEN_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _screenshot_writer():
+    """Write queued (path, image_bytes) pairs to disk in batches."""
+    while True:
+        batch = [_screenshot_queue.get()]
+        while len(batch) < SCREENSHOT_BATCH_SIZE:
+            try:
+                batch.append(_screenshot_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        for screenshot_path, image in batch:
+            try:
+                directory = os.path.dirname(screenshot_path)
+                if directory not in _created_screenshot_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    _created_screenshot_dirs.add(directory)
+                _write_file(screenshot_path, image)
+            except OSError as e:
+                log.error("Failed to write screenshot %s: %s", screenshot_path, e)
+            finally:
+                _screenshot_queue.task_done()
+
+
+threading.Thread(target=_screenshot_writer, name="screenshot-writer", daemon=True).start()
 
 
 def pytest_addoption(parser):
@@ -49,6 +98,18 @@ def pytest_addoption(parser):
         default="1920,1080",
         help="Browser window size (width,height)"
     )
+    parser.addoption(
+        "--no-images",
+        action="store_true",
+        default=False,
+        help="Disable image loading in Chrome for faster page loads"
+    )
+    parser.addoption(
+        "--screenshot-on-pass",
+        action="store_true",
+        default=False,
+        help="Also save a screenshot when a test passes"
+    )
 
 
 @pytest.fixture(scope="session")
@@ -71,47 +132,86 @@ def window_size(request):
     return int(width), int(height)
 
 
-@pytest.fixture(scope="function")
-def driver(request, browser_name, headless_mode, window_size):
+@pytest.fixture(scope="session")
+def images_disabled(request):
+    """Get image loading setting from command line option."""
+    return request.config.getoption("--no-images")
+
+
+@pytest.fixture(scope="session")
+def _chrome_options(headless_mode, window_size, images_disabled):
     """
-    WebDriver fixture that provides browser instance for each test.
-    Supports Chrome, Firefox, and Safari browsers.
+    Chrome options built once per session and reused for every Chrome launch.
+    The browser profile lives on tmpfs where available and is removed afterwards.
+    """
+    profile_root = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    profile_dir = tempfile.mkdtemp(prefix="chrome-profile-", dir=profile_root)
+    yield _build_chrome_options(headless_mode, window_size, images_disabled, profile_dir)
+    shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+# Driver factories keyed by lowercase browser name: (request, headless, window_size) -> driver
+_DRIVER_FACTORIES = {
+    "chrome": lambda request, headless, window_size: _get_chrome_driver(request.getfixturevalue("_chrome_options")),
+    "firefox": lambda request, headless, window_size: _get_firefox_driver(headless, window_size),
+    "safari": lambda request, headless, window_size: _get_safari_driver(window_size),
+}
+
+
+@pytest.fixture(scope="session")
+def _driver_session(request, browser_name, headless_mode, window_size):
+    """
+    WebDriver instance shared by every test in the session.
+    The browser is launched once and quit when the session finishes.
     """
-    driver_instance = None
-    
     try:
-        if browser_name.lower() == "chrome":
-            driver_instance = _get_chrome_driver(headless_mode, window_size)
-        elif browser_name.lower() == "firefox":
-            driver_instance = _get_firefox_driver(headless_mode, window_size)
-        elif browser_name.lower() == "safari":
-            driver_instance = _get_safari_driver(window_size)
-        else:
+        factory = _DRIVER_FACTORIES.get(browser_name.lower())
+        if factory is None:
             raise ValueError(f"Unsupported browser: {browser_name}")
-        
-        # Set implicit wait
-        driver_instance.implicitly_wait(10)
-        
-        # Store driver info for reporting
-        request.node.driver_info = {
-            "browser": browser_name,
-            "headless": headless_mode,
-            "window_size": window_size
-        }
-        
-        yield driver_instance
-        
+        driver_instance = factory(request, headless_mode, window_size)
+
     except Exception as e:
         pytest.fail(f"Failed to initialize {browser_name} driver: {str(e)}")
-    
-    finally:
-        if driver_instance:
-            driver_instance.quit()
 
+    request.addfinalizer(driver_instance.quit)
+    return driver_instance
+
+
+@pytest.fixture(scope="function")
+def driver(request, _driver_session, browser_name, headless_mode, window_size):
+    """
+    WebDriver fixture that provides the shared browser instance to each test.
+    Cookies, web storage and window size are reset after every test so tests
+    stay isolated without paying for a new browser launch.
+    """
+    # Store driver info for reporting
+    request.node.driver_info = {
+        "browser": browser_name,
+        "headless": headless_mode,
+        "window_size": window_size
+    }
+
+    yield _driver_session
+
+    from selenium.common.exceptions import WebDriverException
+    try:
+        _driver_session.delete_all_cookies()
+        _driver_session.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        # Storage is not accessible on pages such as about:blank
+        pass
+    _driver_session.set_window_size(window_size[0], window_size[1])
+    _driver_session.get("about:blank")
+
+
+def _build_chrome_options(headless_mode, window_size, images_disabled=False, profile_dir=None):
+    """Build the Chrome options used for every Chrome launch."""
+    # Selenium is imported per browser so pytest startup does not load it
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
 
-def _get_chrome_driver(headless_mode, window_size):
-    """Initialize Chrome WebDriver with options."""
     chrome_options = ChromeOptions()
+    # Return from navigation once the DOM is ready; page objects wait explicitly
+    chrome_options.page_load_strategy = "eager"
     
     if headless_mode:
         chrome_options.add_argument("--headless")
@@ -127,24 +227,73 @@ def _get_chrome_driver(headless_mode, window_size):
 
     # Performance optimizations
     chrome_options.add_argument("--disable-logging")
-    chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-background-timer-throttling")
     chrome_options.add_argument("--disable-backgrounding-occluded-windows")
     chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-hang-monitor")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--no-default-browser-check")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_argument("--disable-client-side-phishing-detection")
+    chrome_options.add_argument("--disable-component-update")
+    chrome_options.add_argument("--disable-breakpad")
+    # Chrome only honours the last --disable-features switch, so keep them in one list
+    chrome_options.add_argument(
+        "--disable-features=Translate,BackForwardCache,AcceptCHFrame,"
+        "VizDisplayCompositor,CalculateNativeWinOcclusion,MediaRouter,OptimizationHints"
+    )
+
+    prefs = {"profile.default_content_setting_values.notifications": 2}
+    if images_disabled:
+        # Skip image download and decode; visual checks should run without --no-images
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        prefs["profile.managed_default_content_settings.images"] = 2
+    chrome_options.add_experimental_option("prefs", prefs)
 
     # CI/CD specific options
     chrome_options.add_argument("--disable-software-rasterizer")
-    chrome_options.add_argument("--remote-debugging-port=9222")
+    # Each xdist worker runs its own Chrome, so give every worker its own port
+    chrome_options.add_argument(f"--remote-debugging-port={9222 + int(XDIST_WORKER[2:])}")
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    
+
+    if profile_dir:
+        # Keep profile and cache writes off the real disk
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
+        chrome_options.add_argument("--disk-cache-size=1")
+    return chrome_options
+
+
+def _get_chrome_driver(chrome_options):
+    """Initialize Chrome WebDriver with prebuilt options."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+
     # Use WebDriverManager for automatic driver management
-    service = ChromeService(ChromeDriverManager().install())
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        from webdriver_manager.chrome import ChromeDriverManager
+        _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    service = ChromeService(_CHROMEDRIVER_PATH)
     return webdriver.Chrome(service=service, options=chrome_options)
 
 
 def _get_firefox_driver(headless_mode, window_size):
     """Initialize Firefox WebDriver with options."""
+    # Firefox-only imports are deferred so Chrome runs never load them
+    from selenium import webdriver
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+
     firefox_options = FirefoxOptions()
+    firefox_options.page_load_strategy = "eager"
     
     if headless_mode:
         firefox_options.add_argument("--headless")
@@ -158,30 +307,59 @@ def _get_firefox_driver(headless_mode, window_size):
     firefox_options.set_preference("useAutomationExtension", False)
     firefox_options.set_preference("general.useragent.override", "Mozilla/5.0 (X11; Linux x86_64; rv:91.0) Gecko/20100101 Firefox/91.0")
     
-    service = FirefoxService(GeckoDriverManager().install())
+    global _GECKODRIVER_PATH
+    if _GECKODRIVER_PATH is None:
+        from webdriver_manager.firefox import GeckoDriverManager
+        _GECKODRIVER_PATH = GeckoDriverManager().install()
+    service = FirefoxService(_GECKODRIVER_PATH)
     return webdriver.Firefox(service=service, options=firefox_options)
 
 
 def _get_safari_driver(window_size):
     """Initialize Safari WebDriver."""
+    from selenium import webdriver
+
     # Note: Safari doesn't support headless mode
     driver = webdriver.Safari()
     driver.set_window_size(window_size[0], window_size[1])
     return driver
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def test_url():
     """Provide the test URL for tests."""
     return TEST_URL
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def base_url():
     """Provide the base URL for tests."""
     return BASE_URL
 
 
+def _capture_failure_screenshot(driver, screenshot_base):
+    """
+    Capture the current page for a failure report.
+    Chromium drivers encode a quality-60 JPEG through CDP, which is much
+    cheaper than PNG; other browsers fall back to a PNG capture.
+
+    Returns:
+        Tuple of (path with matching extension, image bytes, content type)
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        data = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 60})["data"]
+        return f"{screenshot_base}.jpg", base64.b64decode(data), "image/jpeg"
+    return f"{screenshot_base}.png", driver.get_screenshot_as_png(), "image/png"
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    """Keep a reference to the test's driver once its fixtures are set up."""
+    yield
+    funcargs = getattr(item, "funcargs", None)
+    item._driver = funcargs.get("driver") if funcargs else None
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -191,143 +369,136 @@ def pytest_runtest_makereport(item, call):
     report = outcome.get_result()
     
     # Only capture screenshots for test calls (not setup/teardown)
-    if call.when == "call":
-        driver = getattr(item.funcargs.get('driver'), 'driver', item.funcargs.get('driver'))
+    if call.when != "call":
+        return
+
+    driver = getattr(item, "_driver", None)
+    if not driver:
+        return
+
+    test_name = item.name
+    
+    if report.failed:
+        # Take screenshot on failure
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        screenshot_base = f"{FAILED_SCREENSHOT_DIR}/FAILED_{test_name}_{XDIST_WORKER}_{timestamp}"
         
-        if driver:
-            test_name = item.name
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        try:
+            screenshot_path, image, content_type = _capture_failure_screenshot(driver, screenshot_base)
+            _screenshot_queue.put((screenshot_path, image))
+            log.info("Screenshot saved: %s", screenshot_path)
             
-            if report.failed:
-                # Take screenshot on failure
-                screenshot_name = f"FAILED_{test_name}_{timestamp}.png"
-                screenshot_path = os.path.join(FAILED_SCREENSHOT_DIR, screenshot_name)
-                
-                try:
-                    driver.save_screenshot(screenshot_path)
-                    print(f"\nScreenshot saved: {screenshot_path}")
-                    
-                    # Add screenshot path to report for HTML reporting
-                    if hasattr(report, 'extra'):
-                        report.extra.append({
-                            'name': 'Screenshot',
-                            'path': screenshot_path,
-                            'content_type': 'image/png'
-                        })
-                    
-                except Exception as e:
-                    print(f"\nFailed to take screenshot: {str(e)}")
+            # Add screenshot path to report for HTML reporting
+            if hasattr(report, 'extra'):
+                report.extra.append({
+                    'name': 'Screenshot',
+                    'path': screenshot_path,
+                    'content_type': content_type
+                })
             
-            elif report.passed:
-                # Optionally take screenshot on success (for documentation)
-                screenshot_name = f"PASSED_{test_name}_{timestamp}.png"
-                screenshot_path = os.path.join(PASSED_SCREENSHOT_DIR, screenshot_name)
-                
-                try:
-                    driver.save_screenshot(screenshot_path)
-                    print(f"\nSuccess screenshot saved: {screenshot_path}")
-                except Exception as e:
-                    print(f"\nFailed to take success screenshot: {str(e)}")
+        except Exception as e:
+            log.error("Failed to take screenshot: %s", e)
+    
+    elif report.passed and item.config.getoption("--screenshot-on-pass"):
+        # Optionally take screenshot on success (for documentation)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        screenshot_path = f"{PASSED_SCREENSHOT_DIR}/PASSED_{test_name}_{XDIST_WORKER}_{timestamp}.png"
+        
+        try:
+            _screenshot_queue.put((screenshot_path, driver.get_screenshot_as_png()))
+            log.info("Success screenshot saved: %s", screenshot_path)
+        except Exception as e:
+            log.error("Failed to take success screenshot: %s", e)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_json_runtest_metadata(item, call):
+    """Record the test's marker names in the pytest-json-report entry, once per test."""
+    if call.when != "setup":
+        return {}
+    return {"markers": sorted({marker.name for marker in item.iter_markers()})}
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Wait for queued screenshots to reach the disk before pytest exits."""
+    _screenshot_queue.join()
+    # Page-object error screenshots too; atexit does not run when pytest is in a multiprocessing child
+    flush_screenshots()
+
+
+# Custom markers registered in pytest_configure
+_MARKERS = (
+    ("smoke", "mark test as smoke test"),
+    ("regression", "mark test as regression test"),
+    ("critical", "mark test as critical priority"),
+    ("high", "mark test as high priority"),
+    ("medium", "mark test as medium priority"),
+    ("low", "mark test as low priority"),
+    ("browser_chrome", "run test only on Chrome"),
+    ("browser_firefox", "run test only on Firefox"),
+    ("browser_safari", "run test only on Safari"),
+    ("mobile", "mark test for mobile testing"),
+    ("performance", "mark test as performance test"),
+    ("cross_browser", "cross-browser compatibility tests"),
+    ("responsive", "responsive design tests"),
+    ("browser", "general browser tests"),
+    ("tablet", "tablet device tests"),
+    ("ui", "user interface tests"),
+    ("functional", "functional tests"),
+    ("negative", "negative test cases"),
+    ("edge_case", "edge case scenarios"),
+    ("accessibility", "accessibility tests"),
+    ("memory", "memory leak tests"),
+    ("slow", "tests that take longer than 30 seconds"),
+)
 
 
 def pytest_configure(config):
     """Configure pytest with custom markers and settings."""
-    config.addinivalue_line(
-        "markers", "smoke: mark test as smoke test"
-    )
-    config.addinivalue_line(
-        "markers", "regression: mark test as regression test"
-    )
-    config.addinivalue_line(
-        "markers", "critical: mark test as critical priority"
-    )
-    config.addinivalue_line(
-        "markers", "high: mark test as high priority"
-    )
-    config.addinivalue_line(
-        "markers", "medium: mark test as medium priority"
-    )
-    config.addinivalue_line(
-        "markers", "low: mark test as low priority"
-    )
-    config.addinivalue_line(
-        "markers", "browser_chrome: run test only on Chrome"
-    )
-    config.addinivalue_line(
-        "markers", "browser_firefox: run test only on Firefox"
-    )
-    config.addinivalue_line(
-        "markers", "browser_safari: run test only on Safari"
-    )
-    config.addinivalue_line(
-        "markers", "mobile: mark test for mobile testing"
-    )
-    config.addinivalue_line(
-        "markers", "performance: mark test as performance test"
-    )
-    config.addinivalue_line(
-        "markers", "cross_browser: cross-browser compatibility tests"
-    )
-    config.addinivalue_line(
-        "markers", "responsive: responsive design tests"
-    )
-    config.addinivalue_line(
-        "markers", "browser: general browser tests"
-    )
-    config.addinivalue_line(
-        "markers", "tablet: tablet device tests"
-    )
-    config.addinivalue_line(
-        "markers", "ui: user interface tests"
-    )
-    config.addinivalue_line(
-        "markers", "functional: functional tests"
-    )
-    config.addinivalue_line(
-        "markers", "negative: negative test cases"
-    )
-    config.addinivalue_line(
-        "markers", "edge_case: edge case scenarios"
-    )
-    config.addinivalue_line(
-        "markers", "accessibility: accessibility tests"
-    )
-    config.addinivalue_line(
-        "markers", "memory: memory leak tests"
-    )
-    config.addinivalue_line(
-        "markers", "slow: tests that take longer than 30 seconds"
-    )
+    for name, description in _MARKERS:
+        config.addinivalue_line("markers", f"{name}: {description}")
+
+
+# Name fragments that add markers at collection time; priority fragments are
+# checked in order and only the first match applies
+_BROWSER_NAME_MARKERS = (
+    ("chrome", pytest.mark.browser_chrome),
+    ("firefox", pytest.mark.browser_firefox),
+    ("safari", pytest.mark.browser_safari),
+)
+_PRIORITY_NAME_MARKERS = (
+    ("critical", pytest.mark.critical),
+    ("p1", pytest.mark.critical),
+    ("high", pytest.mark.high),
+    ("p2", pytest.mark.high),
+    ("performance", pytest.mark.performance),
+)
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test names."""
     for item in items:
+        name = item.name.lower()
+
         # Add browser-specific markers
-        if "chrome" in item.name.lower():
-            item.add_marker(pytest.mark.browser_chrome)
-        if "firefox" in item.name.lower():
-            item.add_marker(pytest.mark.browser_firefox)
-        if "safari" in item.name.lower():
-            item.add_marker(pytest.mark.browser_safari)
-        
-        # Add priority markers based on test file or name
-        if "critical" in item.name.lower() or "p1" in item.name.lower():
-            item.add_marker(pytest.mark.critical)
-        elif "high" in item.name.lower() or "p2" in item.name.lower():
-            item.add_marker(pytest.mark.high)
-        elif "performance" in item.name.lower():
-            item.add_marker(pytest.mark.performance)
+        for fragment, marker in _BROWSER_NAME_MARKERS:
+            if fragment in name:
+                item.add_marker(marker)
+
+        # Add priority markers based on test name
+        for fragment, marker in _PRIORITY_NAME_MARKERS:
+            if fragment in name:
+                item.add_marker(marker)
+                break
 
 
 @pytest.fixture(scope="function")
 def performance_timer():
     """Fixture to measure test execution time."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     yield
-    end_time = time.time()
-    execution_time = end_time - start_time
-    print(f"\nTest execution time: {execution_time:.2f} seconds")
+    execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+    print(f"\nTest execution time: {execution_time:.4f} seconds")
 
 
 # Custom assertion helpers
@@ -342,8 +513,13 @@ def assert_popup_not_visible(popup_page, timeout=10):
 
 
 def assert_performance_within_limit(actual_time, limit_seconds, operation_name):
-    """Custom assertion for performance testing."""
-    assert actual_time <= limit_seconds, f"{operation_name} took {actual_time:.2f}s, should be <= {limit_seconds}s"
+    """
+    Custom assertion for performance testing.
+
+    actual_time is in seconds and should come from time.perf_counter_ns()
+    deltas, which are monotonic and unaffected by wall-clock adjustments.
+    """
+    assert actual_time <= limit_seconds, f"{operation_name} took {actual_time:.4f}s, should be <= {limit_seconds}s"
 
 
 # Test data fixtures
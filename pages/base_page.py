@@ -4,14 +4,22 @@ This class contains common methods and properties that all page classes inherit
 It is designed to be robust, reusable, and maintainable with enhanced error handling,
 performance optimizations, and best practices.
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import random
 import time
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from functools import wraps
-from typing import List, Tuple, Optional, Callable, Any, Union
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Tuple, Optional, Callable, Any, Union
 
 from selenium.common.exceptions import (
     TimeoutException,
@@ -24,29 +32,112 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
 from utils.screenshot_helper import ScreenshotHelper
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/test_automation.log'),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import orjson
+except ImportError:  # Optional speed-up; Selenium keeps using the stdlib json module
+    orjson = None
 
 # Constants
 DEFAULT_TIMEOUT = 15
 MAX_RETRIES = 3
-RETRY_DELAY = 1.0
+RETRY_INITIAL_DELAY = 0.05
+RETRY_MAX_DELAY = 1.0
+RETRY_BACKOFF = 2.0
+# Exceptions retry_on_failure retries by default
+_RETRIABLE = (StaleElementReferenceException,)
+WAIT_POLL_FREQUENCY = 0.3
 SCREENSHOT_DIR = "screenshots"
 LOGS_DIR = "logs"
+# Error screenshots per process; after that, failures are only logged
+ERROR_SCREENSHOT_BUDGET = 20
+
+# One ScreenshotHelper per driver; entries go away with the driver
+_SCREENSHOT_HELPERS: "weakref.WeakKeyDictionary[WebDriver, ScreenshotHelper]" = weakref.WeakKeyDictionary()
+
+# All Selenium locator strategies, used to recognise locator tuples on page classes
+_BY_STRATEGIES = frozenset({
+    By.ID, By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT,
+    By.NAME, By.TAG_NAME, By.CLASS_NAME, By.CSS_SELECTOR,
+})
+
+# Locator strategies that can be evaluated inside the browser with querySelector/evaluate
+_JS_LOCATOR_STRATEGIES = {
+    By.CSS_SELECTOR: "css",
+    By.TAG_NAME: "css",
+    By.XPATH: "xpath",
+}
+# Resolves once the load event has fired, or with the readyState check after the timeout
+_PAGE_LOAD_PROMISE = """
+new Promise(function (resolve) {
+    if (document.readyState === 'complete') { resolve(true); return; }
+    window.addEventListener('load', function () { resolve(true); }, {once: true});
+    setTimeout(function () { resolve(document.readyState === 'complete'); }, %d);
+})
+"""
+_PRESENCE_SCRIPT = """
+if (arguments[0] === 'xpath') {
+    return document.evaluate(arguments[1], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+}
+return document.querySelector(arguments[1]) !== null;
+"""
+_BATCH_FIND_SCRIPT = """
+return arguments[0].map(function (locator) {
+    if (locator[0] === 'xpath') {
+        return document.evaluate(locator[1], document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(locator[1]);
+});
+"""
 
 # Ensure directories exist
 os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 os.makedirs(LOGS_DIR, exist_ok=True)
 
+# Configure logging: records are queued and written by a listener thread,
+# so page interactions never block on log file I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler(os.path.join(LOGS_DIR, 'test_automation.log'))
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_file_handler, _log_stream_handler, respect_handler_level=True
+)
+# Same contract as basicConfig: only configure a root logger nobody has set up yet
+if not logging.root.handlers:
+    logging.root.setLevel(logging.INFO)
+    logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _log_listener.start()
+    # Flush queued records before the interpreter exits
+    atexit.register(_log_listener.stop)
+
+
+def _install_fast_json() -> None:
+    """Route Selenium's wire-protocol JSON encoding and decoding through orjson when installed."""
+    if orjson is None:
+        return
+    from selenium.webdriver.remote import utils as remote_utils
+    stdlib_dump_json = remote_utils.dump_json
+
+    def dump_json(json_struct: Any) -> str:
+        try:
+            return orjson.dumps(json_struct).decode()
+        except TypeError:
+            # orjson rejects a few payloads the stdlib accepts, e.g. non-string keys
+            return stdlib_dump_json(json_struct)
+
+    remote_utils.dump_json = dump_json
+    remote_utils.load_json = orjson.loads
+
+
+_install_fast_json()
+
 # Custom Exceptions
 class PageException(Exception):
     """Base exception for page-related errors."""
@@ -60,41 +151,72 @@ class ElementInteractionException(PageException):
     """Raised when element interaction fails."""
     pass
 
-@dataclass
+@dataclass(frozen=True)
 class ElementLocator:
-    """Data class for element locators with metadata."""
+    """
+    Immutable element locator with its Selenium tuple and description precomputed.
+
+    ``value`` is the complete selector. ``primary`` optionally names the one
+    alternative that usually matches; waits try it once before falling back
+    to the complete selector.
+    """
     by: str
     value: str
     description: str = ""
+    primary: str = ""
+    _tuple: Tuple[str, str] = field(init=False, repr=False, compare=False)
+    _description: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        locator_tuple = (self.by, self.value)
+        object.__setattr__(self, "_tuple", locator_tuple)
+        object.__setattr__(self, "_description", self.description or str(locator_tuple))
 
     def to_tuple(self) -> Tuple[str, str]:
         """Convert to tuple format for Selenium."""
-        return (self.by, self.value)
+        return self._tuple
+
+
+@lru_cache(maxsize=512)
+def _locator_from_tuple(locator_tuple: Tuple[str, str]) -> ElementLocator:
+    """Wraps a raw (by, value) tuple so repeated tuples share one ElementLocator."""
+    return ElementLocator(*locator_tuple)
+
 
-def retry_on_failure(max_attempts: int = MAX_RETRIES, delay: float = RETRY_DELAY,
-                    exceptions: tuple = (TimeoutException, StaleElementReferenceException)):
+def _describe(locator: Union[Tuple[str, str], ElementLocator]) -> ElementLocator:
+    """Returns the locator as an ElementLocator, with its Selenium tuple and log description precomputed."""
+    if not isinstance(locator, ElementLocator):
+        locator = _locator_from_tuple(tuple(locator))
+    return locator
+
+def retry_on_failure(max_attempts: int = MAX_RETRIES, initial_delay: float = RETRY_INITIAL_DELAY,
+                    max_delay: float = RETRY_MAX_DELAY, backoff: float = RETRY_BACKOFF,
+                    exceptions: tuple = _RETRIABLE):
     """
-    Decorator to retry operations on failure.
+    Decorator to retry operations on failure with exponential backoff and jitter.
+    Timeouts are not retried by default since the wrapped waits already poll
+    for the full timeout.
 
     Args:
         max_attempts: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        initial_delay: Delay before the first retry in seconds
+        max_delay: Upper bound for the delay between retries in seconds
+        backoff: Multiplier applied to the delay after each attempt
         exceptions: Tuple of exceptions to catch and retry on
     """
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_attempts):
+            attempt = 0
+            while True:
                 try:
                     return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        time.sleep(delay)
-                        continue
-                    break
-            raise last_exception
+                except exceptions:
+                    attempt += 1
+                    if attempt >= max_attempts:
+                        raise
+                    delay = min(max_delay, initial_delay * backoff ** (attempt - 1))
+                    time.sleep(delay * (0.5 + random.random()))
         return wrapper
     return decorator
 
@@ -105,60 +227,190 @@ class BasePage:
     error handling, retry mechanisms, and performance optimizations.
     """
 
-    def __init__(self, driver: WebDriver, default_timeout: int = DEFAULT_TIMEOUT):
+    # Shared by all page objects in the process
+    _error_screenshot_budget = ERROR_SCREENSHOT_BUDGET
+    # Strategy for bare string locators; subclasses get the one most of their locators use
+    _dominant_strategy: str = By.CSS_SELECTOR
+    # One logger per class, named after it; instances share it instead of looking it up
+    logger = logging.getLogger("BasePage")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = logging.getLogger(cls.__name__)
+        strategies = Counter(
+            value.by if isinstance(value, ElementLocator) else value[0]
+            for value in vars(cls).values()
+            if isinstance(value, ElementLocator)
+            or (isinstance(value, tuple) and len(value) == 2 and value[0] in _BY_STRATEGIES)
+        )
+        if strategies:
+            cls._dominant_strategy = strategies.most_common(1)[0][0]
+
+    def __init__(self, driver: WebDriver, default_timeout: int = DEFAULT_TIMEOUT,
+                 poll_frequency: float = WAIT_POLL_FREQUENCY):
         """
         Initialize the base page with WebDriver instance and configuration.
 
         Args:
             driver: WebDriver instance for browser interaction.
             default_timeout: The default maximum time in seconds to wait for elements.
+            poll_frequency: Interval in seconds between explicit wait polls.
         """
         if not driver:
             raise ValueError("WebDriver instance is required")
 
         self.driver = driver
         self.default_timeout = default_timeout
-        self.wait = WebDriverWait(self.driver, default_timeout)
-        self.actions = ActionChains(self.driver)
-        self.logger = logging.getLogger(self.__class__.__name__)
-        # Unified screenshot helper
-        self.screenshot_helper = ScreenshotHelper(self.driver, base_dir=SCREENSHOT_DIR)
+        self.poll_frequency = poll_frequency
+        # Explicit waits only; an implicit wait would stack on every lookup
+        self.driver.implicitly_wait(0)
+        # One WebDriverWait per timeout value, reused across calls
+        self._wait_pool: Dict[int, WebDriverWait] = {}
+        self.wait = self._get_wait(default_timeout)
+        self._actions: Optional[ActionChains] = None
+        # Unified screenshot helper, shared by every page object on this driver
+        self.screenshot_helper = _SCREENSHOT_HELPERS.get(driver)
+        if self.screenshot_helper is None:
+            self.screenshot_helper = ScreenshotHelper(self.driver, base_dir=SCREENSHOT_DIR)
+            _SCREENSHOT_HELPERS[driver] = self.screenshot_helper
+
+        # Resolved elements keyed by locator tuple, reused until they go stale
+        self._element_cache: Dict[Tuple[str, str], WebElement] = {}
 
         # Performance tracking
         self._operation_start_time: Optional[float] = None
         self._performance_metrics: dict = {}
+        self._performance_metrics_view = MappingProxyType(self._performance_metrics)
+
+    @property
+    def actions(self) -> ActionChains:
+        """ActionChains for this driver, created on first use."""
+        if self._actions is None:
+            self._actions = ActionChains(self.driver)
+        return self._actions
+
+    def _get_wait(self, timeout: Optional[int] = None) -> WebDriverWait:
+        """
+        Returns the pooled WebDriverWait for a timeout, creating it on first use.
+
+        Args:
+            timeout: Timeout in seconds. Uses default if None.
+        """
+        actual_timeout = timeout or self.default_timeout
+        wait_instance = self._wait_pool.get(actual_timeout)
+        if wait_instance is None:
+            wait_instance = WebDriverWait(self.driver, actual_timeout, poll_frequency=self.poll_frequency)
+            self._wait_pool[actual_timeout] = wait_instance
+        return wait_instance
 
     @contextmanager
-    def performance_context(self, operation_name: str):
+    def performance_context(self, operation_name: str, *details: Any):
         """
         Context manager for tracking operation performance.
+        Timing is only recorded when the page logger is enabled for DEBUG.
 
         Args:
             operation_name: Name of the operation being tracked
+            *details: Extra parts of the metric name, e.g. the locator description.
+                Joined to the name with underscores only when timing is recorded.
         """
-        start_time = time.time()
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            yield
+            return
+
+        if details:
+            operation_name = "_".join([operation_name, *map(str, details)])
+        start_ns = time.perf_counter_ns()
         try:
             yield
         finally:
-            end_time = time.time()
-            duration = end_time - start_time
+            duration = (time.perf_counter_ns() - start_ns) * 1e-9
             self._performance_metrics[operation_name] = duration
-            self.logger.debug(f"Operation '{operation_name}' completed in {duration:.2f}s")
+            self.logger.debug("Operation '%s' completed in %.4fs", operation_name, duration)
+
+    def get_performance_metrics(self) -> MappingProxyType:
+        """Get a live read-only view of the collected performance metrics."""
+        return self._performance_metrics_view
 
-    def get_performance_metrics(self) -> dict:
-        """Get collected performance metrics."""
+    def snapshot_metrics(self) -> dict:
+        """Get a copy of the collected performance metrics that will not change."""
         return self._performance_metrics.copy()
 
+    def invalidate_cache(self, locator: Union[Tuple[str, str], ElementLocator, None] = None) -> None:
+        """
+        Drops cached elements so the next lookup goes back to the DOM.
+
+        Args:
+            locator: Locator to evict. Clears the whole cache if None.
+        """
+        if locator is None:
+            self._element_cache.clear()
+        else:
+            locator_tuple = locator._tuple if isinstance(locator, ElementLocator) else tuple(locator)
+            self._element_cache.pop(locator_tuple, None)
+
+    def _cached_element(self, locator_tuple: Tuple[str, str]) -> Optional[WebElement]:
+        """Returns the cached element for a locator if it is still attached and visible."""
+        cached = self._element_cache.get(locator_tuple)
+        if cached is None:
+            return None
+        try:
+            if cached.is_displayed():
+                return cached
+        except WebDriverException:
+            # Stale after navigation or re-render
+            pass
+        del self._element_cache[locator_tuple]
+        return None
+
+    def _wait_for_element(self, locator: ElementLocator, condition: Callable,
+                          timeout: Optional[int] = None) -> WebElement:
+        """
+        Resolves an element with a single wait on the given expected condition.
+
+        Args:
+            locator: Locator to resolve; its primary selector is tried first.
+            condition: Expected-condition factory, e.g. EC.presence_of_element_located.
+            timeout: Custom timeout in seconds. Uses default if None.
+
+        Raises:
+            TimeoutException: If the condition is not met within the timeout.
+        """
+        locator_tuple = locator._tuple
+        element = self._cached_element(locator_tuple) or self._probe_primary(locator, condition)
+        if element is None:
+            element = self._get_wait(timeout).until(condition(locator_tuple))
+        self._element_cache[locator_tuple] = element
+        return element
+
+    def _probe_primary(self, locator: ElementLocator, condition: Callable) -> Optional[WebElement]:
+        """
+        Checks a locator's primary selector once, without waiting.
+
+        Returns:
+            The element if the primary selector already satisfies the condition, None otherwise.
+        """
+        if not locator.primary:
+            return None
+        try:
+            return condition((locator.by, locator.primary))(self.driver) or None
+        except WebDriverException:
+            # Primary selector missed; the caller waits on the full selector
+            return None
+
     @retry_on_failure()
-    def find_element(self, locator: Union[Tuple[str, str], ElementLocator],
-                    timeout: Optional[int] = None) -> WebElement:
+    def find_element(self, locator: Union[str, Tuple[str, str], ElementLocator],
+                    timeout: Optional[int] = None, use_cache: bool = True) -> WebElement:
         """
         Finds a single visible element with explicit wait and retry mechanism.
+        A previously resolved element is reused while it is still attached and visible.
 
         Args:
             locator: Tuple containing the locator strategy (By) and the locator string,
-                    or ElementLocator object.
+                    or ElementLocator object. A bare string is resolved with the
+                    strategy most of this page's locators use.
             timeout: Custom timeout in seconds. Uses default if None.
+            use_cache: Whether to reuse and store the resolved element.
 
         Returns:
             The found WebElement.
@@ -166,21 +418,40 @@ class BasePage:
         Raises:
             ElementNotFoundException: If the element is not found within the timeout.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        if isinstance(locator, str):
+            locator = _locator_from_tuple((self._dominant_strategy, locator))
+            if use_cache:
+                # Fast path for an element that is already cached or visible: no logging
+                # or timing. A miss goes through the wait and error handling below.
+                locator_tuple = locator._tuple
+                try:
+                    element = (self._cached_element(locator_tuple)
+                               or EC.visibility_of_element_located(locator_tuple)(self.driver))
+                except WebDriverException:
+                    element = None
+                if element:
+                    self._element_cache[locator_tuple] = element
+                    return element
+
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
+
+        if use_cache:
+            cached = self._cached_element(locator_tuple)
+            if cached is not None:
+                return cached
 
         actual_timeout = timeout or self.default_timeout
-        wait_instance = WebDriverWait(self.driver, actual_timeout)
+        wait_instance = self._get_wait(actual_timeout)
 
-        with self.performance_context(f"find_element_{description}"):
-            self.logger.info(f"Locating element: {description}")
+        with self.performance_context("find_element", description):
+            self.logger.info("Locating element: %s", description)
             try:
-                element = wait_instance.until(EC.visibility_of_element_located(locator_tuple))
-                self.logger.debug(f"Element located successfully: {description}")
+                element = (self._probe_primary(locator, EC.visibility_of_element_located)
+                           or wait_instance.until(EC.visibility_of_element_located(locator_tuple)))
+                if use_cache:
+                    self._element_cache[locator_tuple] = element
+                self.logger.debug("Element located successfully: %s", description)
                 return element
             except TimeoutException as e:
                 error_msg = f"Element not found within {actual_timeout}s: {description}"
@@ -202,28 +473,66 @@ class BasePage:
         Returns:
             A list of WebElements. Returns an empty list if no elements are found.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
         actual_timeout = timeout or self.default_timeout
-        wait_instance = WebDriverWait(self.driver, actual_timeout)
+        wait_instance = self._get_wait(actual_timeout)
 
-        with self.performance_context(f"find_elements_{description}"):
-            self.logger.info(f"Locating elements: {description}")
+        with self.performance_context("find_elements", description):
+            self.logger.info("Locating elements: %s", description)
             try:
-                # Wait for at least one element to be present, then return all
-                wait_instance.until(EC.presence_of_element_located(locator_tuple))
-                elements = self.driver.find_elements(*locator_tuple)
-                self.logger.debug(f"Located {len(elements)} elements: {description}")
+                # Poll find_elements itself so the hit path is a single round trip
+                elements = wait_instance.until(lambda driver: driver.find_elements(*locator_tuple))
+                self.logger.debug("Located %s elements: %s", len(elements), description)
                 return elements
             except TimeoutException:
-                self.logger.warning(f"No elements found within {actual_timeout}s: {description}")
+                self.logger.warning("No elements found within %ss: %s", actual_timeout, description)
                 return []
 
+    def find_elements_batch(self, locators: List[Union[Tuple[str, str], ElementLocator]]) -> List[Optional[WebElement]]:
+        """
+        Resolves several locators in a single execute_script round trip.
+        CSS selector, tag name and XPath locators are evaluated in the browser together;
+        other strategies fall back to a regular driver lookup.
+
+        Args:
+            locators: List of locator tuples or ElementLocator objects.
+
+        Returns:
+            The first matching element for each locator, or None where nothing matched,
+            in the same order as the input.
+
+        Raises:
+            ElementInteractionException: If the batch script fails.
+        """
+        locator_tuples = [locator._tuple if isinstance(locator, ElementLocator) else locator
+                          for locator in locators]
+        results: List[Optional[WebElement]] = [None] * len(locator_tuples)
+        js_indexes = [i for i, (by, _) in enumerate(locator_tuples) if by in _JS_LOCATOR_STRATEGIES]
+
+        with self.performance_context("find_elements_batch"):
+            self.logger.info("Locating %s elements in one batch", len(locator_tuples))
+            try:
+                if js_indexes:
+                    payload = [[_JS_LOCATOR_STRATEGIES[locator_tuples[i][0]], locator_tuples[i][1]]
+                               for i in js_indexes]
+                    found = self.driver.execute_script(_BATCH_FIND_SCRIPT, payload) or []
+                    for i, element in zip(js_indexes, found):
+                        results[i] = element
+
+                for i, (by, value) in enumerate(locator_tuples):
+                    if by not in _JS_LOCATOR_STRATEGIES:
+                        elements = self.driver.find_elements(by, value)
+                        results[i] = elements[0] if elements else None
+            except WebDriverException as e:
+                error_msg = f"Batch element lookup failed: {e}"
+                self.logger.error(error_msg)
+                raise ElementInteractionException(error_msg) from e
+
+            self.logger.debug("Batch located %s/%s elements", sum(r is not None for r in results), len(results))
+            return results
+
     @retry_on_failure()
     def click_element(self, locator: Union[Tuple[str, str], ElementLocator],
                      timeout: Optional[int] = None) -> bool:
@@ -241,22 +550,18 @@ class BasePage:
         Raises:
             ElementInteractionException: If the element cannot be clicked.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
         actual_timeout = timeout or self.default_timeout
-        wait_instance = WebDriverWait(self.driver, actual_timeout)
+        wait_instance = self._get_wait(actual_timeout)
 
-        with self.performance_context(f"click_element_{description}"):
-            self.logger.info(f"Clicking element: {description}")
+        with self.performance_context("click_element", description):
+            self.logger.info("Clicking element: %s", description)
             try:
                 element = wait_instance.until(EC.element_to_be_clickable(locator_tuple))
                 element.click()
-                self.logger.debug(f"Element clicked successfully: {description}")
+                self.logger.debug("Element clicked successfully: %s", description)
                 return True
             except TimeoutException as e:
                 error_msg = f"Element not clickable within {actual_timeout}s: {description}"
@@ -268,7 +573,6 @@ class BasePage:
                 self.logger.error(error_msg)
                 raise ElementInteractionException(error_msg) from e
 
-    @retry_on_failure()
     def send_keys_to_element(self, locator: Union[Tuple[str, str], ElementLocator],
                            text: str, clear_first: bool = True,
                            timeout: Optional[int] = None) -> bool:
@@ -291,21 +595,18 @@ class BasePage:
         if not text and text != "":
             raise ValueError("Text cannot be None")
 
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
-        with self.performance_context(f"send_keys_{description}"):
-            self.logger.info(f"Sending text to element: {description}")
+        with self.performance_context("send_keys", description):
+            self.logger.info("Sending text to element: %s", description)
             try:
-                element = self.find_element(locator_tuple, timeout)
-                if clear_first:
+                element = self._wait_for_element(locator, EC.element_to_be_clickable, timeout)
+                # Reading the value is cheaper than a clear, which scrolls, focuses and fires events
+                if clear_first and element.get_property("value"):
                     element.clear()
                 element.send_keys(text)
-                self.logger.debug(f"Text sent successfully to: {description}")
+                self.logger.debug("Text sent successfully to: %s", description)
                 return True
             except (TimeoutException, WebDriverException) as e:
                 error_msg = f"Failed to send keys to element: {description}"
@@ -326,23 +627,27 @@ class BasePage:
         Returns:
             True if the element is visible, False otherwise.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
         actual_timeout = timeout or self.default_timeout
-        wait_instance = WebDriverWait(self.driver, actual_timeout)
+        wait_instance = self._get_wait(actual_timeout)
+
+        with self.performance_context("check_visibility", description):
+            self.logger.debug("Checking visibility of element: %s", description)
+            # Fast path: one lookup when the element is already displayed
+            try:
+                elements = self.driver.find_elements(*locator_tuple)
+                if elements and elements[0].is_displayed():
+                    return True
+            except WebDriverException:
+                pass
 
-        with self.performance_context(f"check_visibility_{description}"):
-            self.logger.debug(f"Checking visibility of element: {description}")
             try:
                 wait_instance.until(EC.visibility_of_element_located(locator_tuple))
                 return True
             except TimeoutException:
-                self.logger.debug(f"Element not visible within {actual_timeout}s: {description}")
+                self.logger.debug("Element not visible within %ss: %s", actual_timeout, description)
                 return False
 
     def wait_for_element_to_disappear(self, locator: Union[Tuple[str, str], ElementLocator],
@@ -358,24 +663,20 @@ class BasePage:
         Returns:
             True if the element disappeared, False if it's still present after the timeout.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
         actual_timeout = timeout or self.default_timeout
-        wait_instance = WebDriverWait(self.driver, actual_timeout)
+        wait_instance = self._get_wait(actual_timeout)
 
-        with self.performance_context(f"wait_disappear_{description}"):
-            self.logger.info(f"Waiting for element to disappear: {description}")
+        with self.performance_context("wait_disappear", description):
+            self.logger.info("Waiting for element to disappear: %s", description)
             try:
                 result = wait_instance.until(EC.invisibility_of_element_located(locator_tuple))
-                self.logger.debug(f"Element disappeared successfully: {description}")
+                self.logger.debug("Element disappeared successfully: %s", description)
                 return result
             except TimeoutException:
-                self.logger.warning(f"Element did not disappear within {actual_timeout}s: {description}")
+                self.logger.warning("Element did not disappear within %ss: %s", actual_timeout, description)
                 return False
 
     def scroll_to_element(self, locator: Union[Tuple[str, str], ElementLocator],
@@ -394,19 +695,15 @@ class BasePage:
         Raises:
             ElementInteractionException: If scrolling fails.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
-        with self.performance_context(f"scroll_to_{description}"):
-            self.logger.info(f"Scrolling to element: {description}")
+        with self.performance_context("scroll_to", description):
+            self.logger.info("Scrolling to element: %s", description)
             try:
-                element = self.find_element(locator_tuple)
+                element = self._wait_for_element(locator, EC.presence_of_element_located)
                 self.driver.execute_script(f"arguments[0].scrollIntoView({str(align_to_top).lower()});", element)
-                self.logger.debug(f"Scrolled to element successfully: {description}")
+                self.logger.debug("Scrolled to element successfully: %s", description)
                 return True
             except (TimeoutException, WebDriverException) as e:
                 error_msg = f"Failed to scroll to element: {description}"
@@ -442,7 +739,9 @@ class BasePage:
         Returns:
             The value returned by the script.
         """
-        self.logger.info(f"Executing JavaScript: {script[:100]}...")
+        self.logger.info("Executing JavaScript: %s...", script[:100])
+        # Scripts may re-render the DOM, so cached elements are no longer trusted
+        self._element_cache.clear()
         return self.driver.execute_script(script, *args)
 
     def take_screenshot(self, filename: Optional[str] = None,
@@ -485,7 +784,7 @@ class BasePage:
                 )
                 if not path:
                     raise PageException("ScreenshotHelper returned no path")
-                self.logger.info(f"Screenshot saved: {path}")
+                self.logger.info("Screenshot saved: %s", path)
                 return path
             except Exception as e:
                 error_msg = f"Failed to take screenshot: {e}"
@@ -500,8 +799,13 @@ class BasePage:
             context: Context description for the error screenshot.
 
         Returns:
-            Path to the screenshot file, or None if failed.
+            Path to the screenshot file, or None if failed or over budget.
         """
+        if BasePage._error_screenshot_budget <= 0:
+            self.logger.warning("Error screenshot budget exhausted, skipping screenshot for: %s", context)
+            return None
+        BasePage._error_screenshot_budget -= 1
+
         try:
             path = self.screenshot_helper.take_error_screenshot(
                 test_name=self.__class__.__name__,
@@ -509,29 +813,68 @@ class BasePage:
             )
             return path
         except Exception as e:
-            self.logger.warning(f"Failed to take error screenshot: {e}")
+            self.logger.warning("Failed to take error screenshot: %s", e)
             return None
 
+    def _cdp_eval(self, expression: str, await_promise: bool = False) -> Any:
+        """
+        Evaluates a JavaScript expression over the Chrome DevTools Protocol.
+        Skips the WebDriver script endpoint and returns the result by value,
+        so an object literal comes back as a dictionary in one round trip.
+
+        Args:
+            expression: JavaScript expression to evaluate in the page.
+            await_promise: Whether to wait for a returned promise to settle.
+
+        Returns:
+            The value of the expression.
+
+        Raises:
+            WebDriverException: If the driver has no CDP support or the expression threw.
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            raise WebDriverException("CDP is not available for this driver")
+        response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "awaitPromise": await_promise,
+            "returnByValue": True,
+        })
+        if "exceptionDetails" in response:
+            raise WebDriverException(
+                "CDP evaluation failed: %s" % response["exceptionDetails"].get("text", "")
+            )
+        return response.get("result", {}).get("value")
+
     def wait_for_page_load(self, timeout: int = 30):
         """
         Waits for the page to be completely loaded.
+        On Chromium the browser signals the load event in a single CDP call;
+        other browsers poll document.readyState.
         
         Args:
             timeout: Maximum time to wait for page load.
         """
         self.logger.info("Waiting for page to load completely")
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            try:
+                if not self._cdp_eval(_PAGE_LOAD_PROMISE % (timeout * 1000), await_promise=True):
+                    self.logger.warning("Page load timeout reached")
+                return
+            except WebDriverException as e:
+                # e.g. the execution context was replaced by a navigation; fall back to polling
+                self.logger.debug("CDP page load wait failed, polling instead: %s", e)
+
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
         except TimeoutException:
             self.logger.warning("Page load timeout reached")
 
-    @retry_on_failure()
     def hover_over_element(self, locator: Union[Tuple[str, str], ElementLocator],
                           timeout: Optional[int] = None) -> bool:
         """
-        Moves the mouse to hover over an element with retry mechanism.
+        Moves the mouse to hover over an element once it is visible.
 
         Args:
             locator: Tuple containing the locator strategy (By) and the locator string,
@@ -544,19 +887,16 @@ class BasePage:
         Raises:
             ElementInteractionException: If hovering fails.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
-        with self.performance_context(f"hover_over_{description}"):
-            self.logger.info(f"Hovering over element: {description}")
+        with self.performance_context("hover_over", description):
+            self.logger.info("Hovering over element: %s", description)
             try:
-                element = self.find_element(locator_tuple, timeout)
-                self.actions.move_to_element(element).perform()
-                self.logger.debug(f"Hovered over element successfully: {description}")
+                element = self._wait_for_element(locator, EC.visibility_of_element_located, timeout)
+                # Fresh chain per hover so queued moves from earlier calls are not replayed
+                ActionChains(self.driver).move_to_element(element).perform()
+                self.logger.debug("Hovered over element successfully: %s", description)
                 return True
             except (TimeoutException, WebDriverException) as e:
                 error_msg = f"Failed to hover over element: {description}"
@@ -579,19 +919,15 @@ class BasePage:
         Raises:
             ElementInteractionException: If getting text fails.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
-        with self.performance_context(f"get_text_{description}"):
-            self.logger.info(f"Getting text from element: {description}")
+        with self.performance_context("get_text", description):
+            self.logger.info("Getting text from element: %s", description)
             try:
-                element = self.find_element(locator_tuple, timeout)
+                element = self._wait_for_element(locator, EC.presence_of_element_located, timeout)
                 text = element.text or ""
-                self.logger.debug(f"Retrieved text from element: {description} (length: {len(text)})")
+                self.logger.debug("Retrieved text from element: %s (length: %s)", description, len(text))
                 return text
             except (TimeoutException, WebDriverException) as e:
                 error_msg = f"Failed to get text from element: {description}"
@@ -618,19 +954,15 @@ class BasePage:
         if not attribute:
             raise ValueError("Attribute name cannot be empty")
 
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
 
-        with self.performance_context(f"get_attribute_{attribute}_{description}"):
-            self.logger.info(f"Getting attribute '{attribute}' from element: {description}")
+        with self.performance_context("get_attribute", attribute, description):
+            self.logger.info("Getting attribute '%s' from element: %s", attribute, description)
             try:
-                element = self.find_element(locator_tuple, timeout)
+                element = self._wait_for_element(locator, EC.presence_of_element_located, timeout)
                 value = element.get_attribute(attribute)
-                self.logger.debug(f"Retrieved attribute '{attribute}' from element: {description}")
+                self.logger.debug("Retrieved attribute '%s' from element: %s", attribute, description)
                 return value
             except (TimeoutException, WebDriverException) as e:
                 error_msg = f"Failed to get attribute '{attribute}' from element: {description}"
@@ -648,18 +980,103 @@ class BasePage:
         Returns:
             True if the element is present in DOM, False otherwise.
         """
-        if isinstance(locator, ElementLocator):
-            locator_tuple = locator.to_tuple()
-            description = locator.description or str(locator_tuple)
-        else:
-            locator_tuple = locator
-            description = str(locator_tuple)
+        locator = _describe(locator)
+        locator_tuple, description = locator._tuple, locator._description
+
+        with self.performance_context("check_presence", description):
+            by, value = locator_tuple
+            if by in _JS_LOCATOR_STRATEGIES:
+                # A boolean from the page avoids the NoSuchElement error path on misses
+                try:
+                    present = self.driver.execute_script(_PRESENCE_SCRIPT, _JS_LOCATOR_STRATEGIES[by], value)
+                    self.logger.debug("Element %s in DOM: %s", "present" if present else "not present", description)
+                    return bool(present)
+                except WebDriverException:
+                    pass
 
-        with self.performance_context(f"check_presence_{description}"):
             try:
                 self.driver.find_element(*locator_tuple)
-                self.logger.debug(f"Element present in DOM: {description}")
+                self.logger.debug("Element present in DOM: %s", description)
                 return True
             except NoSuchElementException:
-                self.logger.debug(f"Element not present in DOM: {description}")
-                return False
\ No newline at end of file
+                self.logger.debug("Element not present in DOM: %s", description)
+                return False
+
+
+class BasePagePool:
+    """
+    Pool of page objects, each bound to its own WebDriver session, for running
+    independent page actions in parallel.
+
+    One worker thread runs per driver, so the pool size is the parallelism.
+    Size it to the browser capacity available (local CPU cores or free Grid
+    node slots); extra sessions beyond that only queue on the Grid. The pool
+    does not own the drivers; callers create and quit them.
+    """
+
+    def __init__(self, drivers: List[WebDriver], page_class: type = BasePage,
+                 default_timeout: int = DEFAULT_TIMEOUT):
+        """
+        Initialize the pool with one page object per driver.
+
+        Args:
+            drivers: WebDriver sessions to spread work across.
+            page_class: BasePage subclass to instantiate for each driver.
+            default_timeout: Default timeout passed to each page object.
+        """
+        if not drivers:
+            raise ValueError("At least one WebDriver instance is required")
+
+        self.size = len(drivers)
+        self._pages: "queue.Queue[BasePage]" = queue.Queue()
+        for driver in drivers:
+            self._pages.put(page_class(driver, default_timeout))
+
+    def acquire(self) -> BasePage:
+        """Takes a page object out of the pool, blocking until one is free."""
+        return self._pages.get()
+
+    def release(self, page: BasePage) -> None:
+        """Returns a page object to the pool."""
+        self._pages.put(page)
+
+    @contextmanager
+    def page(self):
+        """Context manager that acquires a page object and always releases it."""
+        page = self.acquire()
+        try:
+            yield page
+        finally:
+            self.release(page)
+
+    def map(self, fn: Callable[[BasePage, Any], Any], inputs: Iterable[Any]) -> List[Any]:
+        """
+        Runs fn(page, item) for every input across the pooled sessions.
+
+        Args:
+            fn: Callable taking a page object and one input item.
+            inputs: Items to process; each one gets its own page object for the call.
+
+        Returns:
+            Results in input order. The first exception raised by fn is re-raised.
+        """
+        def run(item):
+            with self.page() as page:
+                return fn(page, item)
+
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="page-pool") as executor:
+            return list(executor.map(run, inputs))
+
+    def parallel_find_elements(self, locators: List[Union[Tuple[str, str], ElementLocator]],
+                               timeout: Optional[int] = None) -> List[List[WebElement]]:
+        """
+        Resolves each locator on whichever session is free.
+
+        Args:
+            locators: Locators to look up; sessions should already be on the target page.
+            timeout: Custom timeout in seconds. Uses default if None.
+
+        Returns:
+            A list of matched elements per locator, in input order.
+        """
+        return self.map(lambda page, locator: page.find_elements(locator, timeout), locators)
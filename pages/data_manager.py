@@ -4,11 +4,129 @@ Data Manager for Insider Test Automation Project
 Handles test data validation, bug reproduction, and expected vs actual result comparison.
 """
 
+import re
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import Any, Dict
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from pages.popup_page import PopupPage
+from pages.product_page import ProductPage
+
+
+# Locators shared by the bug validations
+_SHOW_INSTANTLY_LOCATOR = (By.XPATH, "//button[normalize-space()='SHOW INSTANTLY']")
+_ADD_TO_CART_LOCATORS = (
+    (By.XPATH, "//button[normalize-space()='Add to Cart']"),
+    (By.XPATH, "//button[normalize-space()='ADD TO CART']"),
+    (By.CSS_SELECTOR, ".add-to-cart, .btn-add-cart"),
+    (By.CSS_SELECTOR, "button[class*='add-to-cart']"),
+)
+_CART_COUNT_LOCATORS = (
+    (By.CSS_SELECTOR, ".cart-count"),
+    (By.CSS_SELECTOR, ".cart-badge"),
+    (By.CSS_SELECTOR, "span[class*='cart']"),
+    (By.CSS_SELECTOR, "[data-testid='cart-count']"),
+)
+# Bug validations that can run side by side, each in its own browser session
+_PARALLEL_VALIDATIONS = ("BUG001", "BUG002", "BUG006", "BUG007", "BUG008")
+_VALIDATION_WORKERS = 4
+_CART_DIGITS = re.compile(r'\d+')
+
+# Reads the cart count in one round trip from the [by, value] locators in arguments[0]:
+# the first visible badge wins. Returns [locator index, count], or null if none is visible.
+_CART_COUNT_SCRIPT = """
+var locators = arguments[0];
+for (var i = 0; i < locators.length; i++) {
+    var element = locators[i][0] === 'xpath'
+        ? document.evaluate(locators[i][1], document, null,
+              XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(locators[i][1]);
+    if (element && element.getClientRects().length > 0
+            && getComputedStyle(element).visibility !== 'hidden') {
+        var match = (element.textContent || '').match(/\\d+/);
+        return [i, match ? parseInt(match[0], 10) : 0];
+    }
+}
+return null;
+"""
+
+# Records when a visible popup first shows up, measured in the browser from just before the trigger click
+_POPUP_TIMER_SCRIPT = """
+var selector = arguments[0];
+window.__popupT0 = performance.now();
+window.__popupT1 = null;
+new MutationObserver(function (mutations, observer) {
+    var popup = document.querySelector(selector);
+    if (popup && popup.getClientRects().length) {
+        window.__popupT1 = performance.now();
+        observer.disconnect();
+    }
+}).observe(document.body, {childList: true, subtree: true, attributes: true});
+"""
+_POPUP_ELAPSED_SCRIPT = (
+    "return typeof window.__popupT1 === 'number' ? window.__popupT1 - window.__popupT0 : null;"
+)
+
+# Page URL, JavaScript availability and popup trigger presence for the compatibility check
+_COMPATIBILITY_PROBE_SCRIPT = """
+return {
+    url: location.href,
+    jsOk: typeof document !== 'undefined',
+    hasTrigger: document.evaluate(arguments[0], document, null, XPathResult.BOOLEAN_TYPE, null).booleanValue
+};
+"""
+
+# Single round-trip visibility check for an already resolved popup element.
+# Uses getClientRects, not offsetParent, which is always null for position: fixed modals
+_POPUP_VISIBLE_SCRIPT = (
+    "return arguments[0].getClientRects().length > 0"
+    " && getComputedStyle(arguments[0]).visibility !== 'hidden';"
+)
+
+
+@dataclass
+class BugResult:
+    """Outcome of a single bug validation, converted to a dictionary once it is complete."""
+    bug_id: str
+    description: str
+    reproduced: bool = False
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+def _bug(bug_id, description):
+    """
+    Wrap a bug validation with the shared result bookkeeping.
+    
+    The decorated method receives a fresh BugResult after self and fills it in.
+    Any exception is recorded under details["error"], and the result is stored in
+    bug_reproductions and returned.
+    
+    Args:
+        bug_id: Bug identifier, e.g. "BUG001"
+        description: Short bug description
+        
+    Returns:
+        Decorator for a validate_bug_* method
+    """
+    def decorator(validation):
+        @wraps(validation)
+        def wrapper(self, *args, **kwargs):
+            result = BugResult(bug_id, description)
+            try:
+                validation(self, result, *args, **kwargs)
+            except Exception as e:
+                result.details["error"] = str(e)
+            results = asdict(result)
+            self.bug_reproductions[bug_id] = results
+            return results
+        return wrapper
+    return decorator
 
 
 class DataManager:
@@ -22,10 +140,31 @@ class DataManager:
             driver: WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        # Explicit waits only: an implicit wait would stack on every WebDriverWait poll
+        self.driver.implicitly_wait(0)
+        # One WebDriverWait per timeout, reused by every helper
+        self._wait_cache = {}
+        self.wait = self._wait(10)
         self.test_results = {}
         self.performance_metrics = {}
         self.bug_reproductions = {}
+        # How often each fallback locator matched, so the usual winner is tried first
+        self._locator_hits = Counter()
+    
+    def _wait(self, timeout):
+        """
+        Get the cached WebDriverWait for a timeout, creating it on first use.
+        
+        Args:
+            timeout: Wait timeout in seconds
+            
+        Returns:
+            WebDriverWait instance
+        """
+        wait = self._wait_cache.get(timeout)
+        if wait is None:
+            wait = self._wait_cache[timeout] = WebDriverWait(self.driver, timeout)
+        return wait
     
     def is_element_present(self, locator, timeout=10):
         """
@@ -39,7 +178,7 @@ class DataManager:
             Boolean indicating if element is present
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.presence_of_element_located(locator))
             return True
         except TimeoutException:
@@ -57,7 +196,7 @@ class DataManager:
             Boolean indicating if element is visible
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self._wait(timeout)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
@@ -71,7 +210,7 @@ class DataManager:
             locator: Tuple of (By, locator_string)
             timeout: Wait timeout in seconds
         """
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout)
         element = wait.until(EC.element_to_be_clickable(locator))
         element.click()
     
@@ -86,7 +225,7 @@ class DataManager:
         Returns:
             Element text content
         """
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout)
         element = wait.until(EC.visibility_of_element_located(locator))
         return element.text
     
@@ -102,57 +241,76 @@ class DataManager:
         """
         return self.driver.execute_script(script)
     
-    def validate_bug_001_url_dependency(self, base_url, test_url):
+    @_bug("BUG001", "URL parameter dependency")
+    def validate_bug_001_url_dependency(self, result, base_url, test_url, second_driver=None):
         """
         Validate BUG001: Production Blocker - URL parameter dependency.
         
         Args:
             base_url: Base URL without parameters
             test_url: Test URL with parameters
+            second_driver: Optional extra WebDriver to load test_url on concurrently
             
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "bug_id": "BUG001",
-            "description": "URL parameter dependency",
-            "reproduced": False,
-            "details": {}
-        }
+        if second_driver is None:
+            # Test base URL without parameters, then the URL with parameters
+            test_panel_found = self._show_instantly_available(base_url)
+            test_panel_with_params = self._show_instantly_available(test_url)
+        else:
+            # Load both URLs at the same time on separate sessions
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                base_check = executor.submit(self._show_instantly_available, base_url)
+                params_check = executor.submit(DataManager(second_driver)._show_instantly_available, test_url)
+                test_panel_found = base_check.result()
+                test_panel_with_params = params_check.result()
         
-        try:
-            # Test base URL without parameters
-            self.driver.get(base_url)
-            time.sleep(3)
-            
-            # Try to find test panel or popup trigger
-            test_panel_found = self.is_element_present((By.XPATH, "//button[contains(text(), 'SHOW INSTANTLY')]"))
-            results["details"]["base_url_functional"] = test_panel_found
-            
-            # Test URL with parameters
-            self.driver.get(test_url)
-            time.sleep(3)
-            
-            test_panel_with_params = self.is_element_present((By.XPATH, "//button[contains(text(), 'SHOW INSTANTLY')]"))
-            results["details"]["test_url_functional"] = test_panel_with_params
-            
-            # Bug is reproduced if base URL doesn't work but test URL does
-            if not test_panel_found and test_panel_with_params:
-                results["reproduced"] = True
-                results["details"]["conclusion"] = "System only works with specific URL parameters"
-            elif test_panel_found and test_panel_with_params:
-                results["reproduced"] = False
-                results["details"]["conclusion"] = "System works with both URLs - Bug may be fixed"
-            else:
-                results["details"]["conclusion"] = "System not functional with either URL"
+        result.details["base_url_functional"] = test_panel_found
+        result.details["test_url_functional"] = test_panel_with_params
+        
+        # Bug is reproduced if base URL doesn't work but test URL does
+        if not test_panel_found and test_panel_with_params:
+            result.reproduced = True
+            result.details["conclusion"] = "System only works with specific URL parameters"
+        elif test_panel_found and test_panel_with_params:
+            result.reproduced = False
+            result.details["conclusion"] = "System works with both URLs - Bug may be fixed"
+        else:
+            result.details["conclusion"] = "System not functional with either URL"
+    
+    def js_click(self, locator):
+        """
+        Click an element through JavaScript, without waiting for it to be clickable.
+        
+        Args:
+            locator: Tuple of (By, locator_string)
             
-        except Exception as e:
-            results["details"]["error"] = str(e)
+        Returns:
+            True if the element was found and clicked, False otherwise
+        """
+        elements = self.driver.find_elements(*locator)
+        if not elements:
+            return False
+        self.driver.execute_script("arguments[0].click();", elements[0])
+        return True
+    
+    def _show_instantly_available(self, url):
+        """
+        Load a URL and check whether the SHOW INSTANTLY trigger renders.
         
-        self.bug_reproductions["BUG001"] = results
-        return results
+        Args:
+            url: URL to load
+            
+        Returns:
+            True if the trigger appears, False otherwise
+        """
+        self.driver.get(url)
+        # Polls until the trigger is present or the wait times out
+        return self.is_element_present(_SHOW_INSTANTLY_LOCATOR)
     
-    def validate_bug_002_add_to_cart(self, popup_page):
+    @_bug("BUG002", "Add to Cart button not working")
+    def validate_bug_002_add_to_cart(self, result, popup_page):
         """
         Validate BUG002: Add to Cart button not working.
         
@@ -162,71 +320,51 @@ class DataManager:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "bug_id": "BUG002",
-            "description": "Add to Cart button not working",
-            "reproduced": False,
-            "details": {}
-        }
+        # Get initial cart count
+        initial_cart_count = self._get_cart_count()
+        result.details["initial_cart_count"] = initial_cart_count
         
-        try:
-            # Get initial cart count
-            initial_cart_count = self._get_cart_count()
-            results["details"]["initial_cart_count"] = initial_cart_count
+        # Trigger popup
+        if self._ensure_popup_open(popup_page):
+            popup_page.wait_for_popup_to_appear(timeout=5)
             
-            # Trigger popup
-            if popup_page.click_show_instantly_button():
-                time.sleep(2)
-                
-                # Look for Add to Cart button in popup
-                add_to_cart_locators = [
-                    (By.XPATH, "//button[contains(text(), 'Add to Cart')]"),
-                    (By.XPATH, "//button[contains(text(), 'ADD TO CART')]"),
-                    (By.CSS_SELECTOR, ".add-to-cart, .btn-add-cart"),
-                    (By.XPATH, "//button[contains(@class, 'add-to-cart')]")
-                ]
-                
-                add_to_cart_found = False
-                for locator in add_to_cart_locators:
-                    if self.is_element_visible(locator, timeout=2):
-                        add_to_cart_found = True
-                        results["details"]["add_to_cart_button_found"] = True
+            # Look for Add to Cart button in popup
+            add_to_cart_found = False
+            for locator in self._by_hits(_ADD_TO_CART_LOCATORS):
+                if self.is_element_visible(locator, timeout=2):
+                    add_to_cart_found = True
+                    self._locator_hits[locator] += 1
+                    result.details["add_to_cart_button_found"] = True
+                    
+                    # Try to click Add to Cart
+                    try:
+                        self.click_element(locator, timeout=5)
                         
-                        # Try to click Add to Cart
-                        try:
-                            self.click_element(locator, timeout=5)
-                            time.sleep(2)
-                            
-                            # Check if cart count increased
-                            final_cart_count = self._get_cart_count()
-                            results["details"]["final_cart_count"] = final_cart_count
-                            
-                            if final_cart_count > initial_cart_count:
-                                results["reproduced"] = False
-                                results["details"]["conclusion"] = "Add to Cart working - Bug may be fixed"
-                            else:
-                                results["reproduced"] = True
-                                results["details"]["conclusion"] = "Add to Cart button not functional"
-                            
-                        except TimeoutException:
-                            results["reproduced"] = True
-                            results["details"]["conclusion"] = "Add to Cart button not clickable"
+                        # Check if cart count increased
+                        final_cart_count = self._wait_for_cart_count_above(initial_cart_count)
+                        result.details["final_cart_count"] = final_cart_count
                         
-                        break
-                
-                if not add_to_cart_found:
-                    results["details"]["add_to_cart_button_found"] = False
-                    results["details"]["conclusion"] = "Add to Cart button not found in popup"
-            else:
-                results["details"]["conclusion"] = "Could not trigger popup to test Add to Cart"
-                
-        except Exception as e:
-            results["details"]["error"] = str(e)
-        
-        self.bug_reproductions["BUG002"] = results
-        return results
+                        if final_cart_count > initial_cart_count:
+                            result.reproduced = False
+                            result.details["conclusion"] = "Add to Cart working - Bug may be fixed"
+                        else:
+                            result.reproduced = True
+                            result.details["conclusion"] = "Add to Cart button not functional"
+                        
+                    except TimeoutException:
+                        result.reproduced = True
+                        result.details["conclusion"] = "Add to Cart button not clickable"
+                    
+                    break
+            
+            if not add_to_cart_found:
+                result.details["add_to_cart_button_found"] = False
+                result.details["conclusion"] = "Add to Cart button not found in popup"
+        else:
+            result.details["conclusion"] = "Could not trigger popup to test Add to Cart"
     
-    def validate_bug_006_performance(self, popup_page, expected_limit=2.0):
+    @_bug("BUG006", "Performance Critical - Load delay")
+    def validate_bug_006_performance(self, result, popup_page, expected_limit=2.0):
         """
         Validate BUG006: Performance Critical - 4.49s delay.
         
@@ -237,48 +375,59 @@ class DataManager:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "bug_id": "BUG006",
-            "description": "Performance Critical - Load delay",
-            "reproduced": False,
-            "details": {}
-        }
+        # The measurement needs the popup to open from scratch
+        if popup_page.popup_element is not None and self._popup_displayed(popup_page):
+            popup_page.click_close_button()
+            self._popup_still_visible(popup_page)
         
+        # The campaign script renders the trigger, so wait for it before starting the clock
+        trigger = popup_page.SHOW_INSTANTLY_BUTTON.to_tuple()
         try:
-            # Measure popup load time
-            start_time = time.time()
+            self._wait(10).until(EC.presence_of_element_located(trigger))
+        except TimeoutException:
+            pass  # Reported below as a failed trigger
+        
+        # Measure popup load time in the browser, so the result is not rounded up to the next poll
+        self.driver.execute_script(_POPUP_TIMER_SCRIPT, popup_page.POPUP_CONTAINER.value)
+        start_time = time.time()
+        
+        if self.js_click(trigger):
+            elapsed_ms = [None]
             
-            if popup_page.click_show_instantly_button():
-                # Wait for popup to appear and measure time
-                popup_appeared = popup_page.wait_for_popup_to_appear(timeout=10)
-                
-                end_time = time.time()
-                load_time = end_time - start_time
-                
-                results["details"]["load_time"] = round(load_time, 2)
-                results["details"]["expected_limit"] = expected_limit
-                results["details"]["popup_appeared"] = popup_appeared
-                
-                if load_time > expected_limit:
-                    results["reproduced"] = True
-                    results["details"]["conclusion"] = f"Performance issue confirmed: {load_time}s > {expected_limit}s"
-                else:
-                    results["reproduced"] = False
-                    results["details"]["conclusion"] = f"Performance acceptable: {load_time}s <= {expected_limit}s"
-                
-                # Store performance metrics
-                self.performance_metrics["popup_load_time"] = load_time
-                
+            def popup_rendered(driver):
+                elapsed_ms[0] = driver.execute_script(_POPUP_ELAPSED_SCRIPT)
+                return elapsed_ms[0] is not None
+            
+            try:
+                popup_appeared = self._wait(10).until(popup_rendered)
+            except TimeoutException:
+                # The observer is gone if the trigger reloaded the page, so check the DOM directly
+                popup_appeared = popup_page.is_popup_visible(timeout=1)
+            
+            if elapsed_ms[0] is not None:
+                load_time = elapsed_ms[0] / 1000
             else:
-                results["details"]["conclusion"] = "Could not trigger popup to measure performance"
-                
-        except Exception as e:
-            results["details"]["error"] = str(e)
-        
-        self.bug_reproductions["BUG006"] = results
-        return results
+                load_time = time.time() - start_time
+            
+            result.details["load_time"] = round(load_time, 2)
+            result.details["expected_limit"] = expected_limit
+            result.details["popup_appeared"] = popup_appeared
+            
+            if load_time > expected_limit:
+                result.reproduced = True
+                result.details["conclusion"] = f"Performance issue confirmed: {load_time}s > {expected_limit}s"
+            else:
+                result.reproduced = False
+                result.details["conclusion"] = f"Performance acceptable: {load_time}s <= {expected_limit}s"
+            
+            # Store performance metrics
+            self.performance_metrics["popup_load_time"] = load_time
+            
+        else:
+            result.details["conclusion"] = "Could not trigger popup to measure performance"
     
-    def validate_bug_007_content_mapping(self, popup_page, product_page, expected_product="Mug"):
+    @_bug("BUG007", "Content Critical - Incorrect product mapping")
+    def validate_bug_007_content_mapping(self, result, popup_page, product_page, expected_product="Mug"):
         """
         Validate BUG007: Content Critical - 90% incorrect product mapping.
         
@@ -290,61 +439,48 @@ class DataManager:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "bug_id": "BUG007",
-            "description": "Content Critical - Incorrect product mapping",
-            "reproduced": False,
-            "details": {}
-        }
+        # Get page title/product name
+        page_title = product_page.get_page_title_text()
+        result.details["page_title"] = page_title
         
-        try:
-            # Get page title/product name
-            page_title = product_page.get_page_title_text()
-            results["details"]["page_title"] = page_title
+        # Trigger popup
+        if self._ensure_popup_open(popup_page):
+            popup_page.wait_for_popup_to_appear(timeout=5)
             
-            # Trigger popup
-            if popup_page.click_show_instantly_button():
-                time.sleep(2)
-                
-                # Get popup content
-                popup_content = popup_page.get_popup_content_text()
-                popup_title = popup_page.get_popup_title()
-                
-                results["details"]["popup_content"] = popup_content
-                results["details"]["popup_title"] = popup_title
-                results["details"]["expected_product"] = expected_product
-                
-                # Check if expected product is in page title
-                page_has_expected_product = expected_product.lower() in page_title.lower()
-                results["details"]["page_has_expected_product"] = page_has_expected_product
-                
-                # Check if popup shows the same product
-                popup_has_expected_product = (
-                    expected_product.lower() in popup_content.lower() or
-                    expected_product.lower() in popup_title.lower()
-                )
-                results["details"]["popup_has_expected_product"] = popup_has_expected_product
-                
-                # Determine if content mapping is correct
-                if page_has_expected_product and popup_has_expected_product:
-                    results["reproduced"] = False
-                    results["details"]["conclusion"] = "Product mapping correct - Bug may be fixed"
-                elif page_has_expected_product and not popup_has_expected_product:
-                    results["reproduced"] = True
-                    results["details"]["conclusion"] = "Product mapping incorrect - Popup shows wrong product"
-                else:
-                    results["details"]["conclusion"] = "Cannot determine product mapping accuracy"
-                    
+            # Get popup content
+            popup_content = popup_page.get_popup_content_text()
+            popup_title = popup_page.get_popup_title()
+            
+            result.details["popup_content"] = popup_content
+            result.details["popup_title"] = popup_title
+            result.details["expected_product"] = expected_product
+            
+            # Case-insensitive matching, lowercasing each string once
+            product = expected_product.lower()
+            
+            # Check if expected product is in page title
+            page_has_expected_product = product in page_title.lower()
+            result.details["page_has_expected_product"] = page_has_expected_product
+            
+            # Check if popup shows the same product
+            popup_has_expected_product = product in popup_content.lower() or product in popup_title.lower()
+            result.details["popup_has_expected_product"] = popup_has_expected_product
+            
+            # Determine if content mapping is correct
+            if page_has_expected_product and popup_has_expected_product:
+                result.reproduced = False
+                result.details["conclusion"] = "Product mapping correct - Bug may be fixed"
+            elif page_has_expected_product and not popup_has_expected_product:
+                result.reproduced = True
+                result.details["conclusion"] = "Product mapping incorrect - Popup shows wrong product"
             else:
-                results["details"]["conclusion"] = "Could not trigger popup to test content mapping"
+                result.details["conclusion"] = "Cannot determine product mapping accuracy"
                 
-        except Exception as e:
-            results["details"]["error"] = str(e)
-        
-        self.bug_reproductions["BUG007"] = results
-        return results
+        else:
+            result.details["conclusion"] = "Could not trigger popup to test content mapping"
     
-    def validate_bug_008_close_functionality(self, popup_page):
+    @_bug("BUG008", "UX Critical - Pop-up close buttons not working")
+    def validate_bug_008_close_functionality(self, result, popup_page):
         """
         Validate BUG008: UX Critical - Pop-up close buttons not working.
         
@@ -354,71 +490,154 @@ class DataManager:
         Returns:
             Dictionary with validation results
         """
-        results = {
-            "bug_id": "BUG008",
-            "description": "UX Critical - Pop-up close buttons not working",
-            "reproduced": False,
-            "details": {}
-        }
-        
-        try:
-            # Test X button close
-            if popup_page.click_show_instantly_button():
-                time.sleep(1)
-                
-                # Verify popup is open
-                popup_visible_before = popup_page.is_popup_visible()
-                results["details"]["popup_visible_before_close"] = popup_visible_before
+        # Test X button close
+        if self._ensure_popup_open(popup_page):
+            # Verify popup is open
+            popup_visible_before = popup_page.wait_for_popup_to_appear(timeout=5)
+            result.details["popup_visible_before_close"] = popup_visible_before
+            
+            if popup_visible_before:
+                # Try to close with X button
+                close_success = popup_page.click_close_button()
+                result.details["close_button_clicked"] = close_success
                 
-                if popup_visible_before:
-                    # Try to close with X button
-                    close_success = popup_page.click_close_button()
-                    results["details"]["close_button_clicked"] = close_success
+                if close_success:
+                    popup_visible_after = self._popup_still_visible(popup_page)
+                    result.details["popup_visible_after_close"] = popup_visible_after
                     
-                    if close_success:
-                        time.sleep(1)
-                        popup_visible_after = popup_page.is_popup_visible()
-                        results["details"]["popup_visible_after_close"] = popup_visible_after
-                        
-                        if popup_visible_after:
-                            results["reproduced"] = True
-                            results["details"]["x_button_conclusion"] = "X button not working - popup still visible"
-                        else:
-                            results["details"]["x_button_conclusion"] = "X button working - popup closed"
+                    if popup_visible_after:
+                        result.reproduced = True
+                        result.details["x_button_conclusion"] = "X button not working - popup still visible"
                     else:
-                        results["reproduced"] = True
-                        results["details"]["x_button_conclusion"] = "X button not clickable"
-                
-                # Test outside click close (if popup still open)
-                if popup_page.is_popup_visible():
-                    outside_click_success = popup_page.click_outside_popup()
-                    results["details"]["outside_click_attempted"] = outside_click_success
-                    
-                    if outside_click_success:
-                        time.sleep(1)
-                        popup_visible_after_outside = popup_page.is_popup_visible()
-                        results["details"]["popup_visible_after_outside_click"] = popup_visible_after_outside
-                        
-                        if popup_visible_after_outside:
-                            results["reproduced"] = True
-                            results["details"]["outside_click_conclusion"] = "Outside click not working"
-                        else:
-                            results["details"]["outside_click_conclusion"] = "Outside click working"
-                
-                # Overall conclusion
-                if results["reproduced"]:
-                    results["details"]["conclusion"] = "Close functionality not working properly"
+                        result.details["x_button_conclusion"] = "X button working - popup closed"
                 else:
-                    results["details"]["conclusion"] = "Close functionality working - Bug may be fixed"
+                    result.reproduced = True
+                    result.details["x_button_conclusion"] = "X button not clickable"
+            
+            # Test outside click close (if popup still open)
+            if self._popup_displayed(popup_page):
+                outside_click_success = popup_page.click_outside_popup()
+                result.details["outside_click_attempted"] = outside_click_success
+                
+                if outside_click_success:
+                    popup_visible_after_outside = self._popup_still_visible(popup_page)
+                    result.details["popup_visible_after_outside_click"] = popup_visible_after_outside
                     
+                    if popup_visible_after_outside:
+                        result.reproduced = True
+                        result.details["outside_click_conclusion"] = "Outside click not working"
+                    else:
+                        result.details["outside_click_conclusion"] = "Outside click working"
+            
+            # Overall conclusion
+            if result.reproduced:
+                result.details["conclusion"] = "Close functionality not working properly"
             else:
-                results["details"]["conclusion"] = "Could not trigger popup to test close functionality"
+                result.details["conclusion"] = "Close functionality working - Bug may be fixed"
                 
-        except Exception as e:
-            results["details"]["error"] = str(e)
+        else:
+            result.details["conclusion"] = "Could not trigger popup to test close functionality"
+    
+    def _popup_displayed(self, popup_page):
+        """
+        Check popup visibility with one script call on the cached container.
         
-        self.bug_reproductions["BUG008"] = results
-        return results
+        Args:
+            popup_page: PopupPage instance
+            
+        Returns:
+            True if the popup is currently displayed, False otherwise
+        """
+        popup = popup_page.popup_element
+        if popup is None:
+            return popup_page.is_popup_visible()
+        try:
+            return bool(self.driver.execute_script(_POPUP_VISIBLE_SCRIPT, popup))
+        except StaleElementReferenceException:
+            # Removed from the DOM, so it cannot be visible
+            return False
+    
+    def _ensure_popup_open(self, popup_page):
+        """
+        Reuse a popup left open by an earlier validation, otherwise trigger it.
+        
+        Args:
+            popup_page: PopupPage instance
+            
+        Returns:
+            True if the popup is open or was triggered, False otherwise
+        """
+        if popup_page.popup_element is not None and self._popup_displayed(popup_page):
+            return True
+        return popup_page.click_show_instantly_button()
+    
+    def _popup_still_visible(self, popup_page, timeout=2):
+        """
+        Wait for the popup to close after a close attempt.
+        
+        Args:
+            popup_page: PopupPage instance
+            timeout: Wait timeout in seconds
+            
+        Returns:
+            True if the popup is still visible after the timeout, False once it is gone
+        """
+        try:
+            self._wait(timeout).until(EC.invisibility_of_element_located(popup_page.POPUP_CONTAINER.to_tuple()))
+            return False
+        except TimeoutException:
+            return True
+    
+    def _wait_for_cart_count_above(self, count, timeout=5):
+        """
+        Poll the cart count until it exceeds the given value.
+        
+        Args:
+            count: Cart count to compare against
+            timeout: Wait timeout in seconds
+            
+        Returns:
+            The last cart count read
+        """
+        last_count = [count]
+        
+        def cart_count_increased(driver):
+            last_count[0] = self._get_cart_count()
+            return last_count[0] > count
+        
+        try:
+            self._wait(timeout).until(cart_count_increased)
+        except TimeoutException:
+            pass
+        return last_count[0]
+    
+    def _by_hits(self, locators):
+        """
+        Order fallback locators by how often they have matched so far.
+        
+        Args:
+            locators: Sequence of locator tuples in their default order
+            
+        Returns:
+            List of locators, most frequently matched first; ties keep the default order
+        """
+        return sorted(locators, key=lambda locator: -self._locator_hits[locator])
+    
+    def _visible_text(self, locator, timeout=2):
+        """
+        Get the text of an element once it is visible, in a single wait.
+        
+        Args:
+            locator: Element locator tuple
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            Element text, or None if the element never became visible or went stale
+        """
+        try:
+            return self._wait(timeout).until(EC.visibility_of_element_located(locator)).text
+        except (TimeoutException, StaleElementReferenceException):
+            return None
     
     def _get_cart_count(self):
         """
@@ -427,26 +646,69 @@ class DataManager:
         Returns:
             Integer cart count, 0 if not found
         """
-        cart_locators = [
-            (By.CSS_SELECTOR, ".cart-count"),
-            (By.CSS_SELECTOR, ".cart-badge"),
-            (By.XPATH, "//span[contains(@class, 'cart')]//text()"),
-            (By.CSS_SELECTOR, "[data-testid='cart-count']")
-        ]
+        locators = self._by_hits(_CART_COUNT_LOCATORS)
+        try:
+            hit = self.driver.execute_script(_CART_COUNT_SCRIPT, locators)
+        except WebDriverException:
+            hit = None
+        if hit is not None:
+            index, count = hit
+            self._locator_hits[locators[index]] += 1
+            return int(count)
         
-        for locator in cart_locators:
-            try:
-                if self.is_element_visible(locator, timeout=2):
-                    count_text = self.get_element_text(locator, timeout=2)
-                    # Extract number from text
-                    import re
-                    numbers = re.findall(r'\d+', count_text)
-                    return int(numbers[0]) if numbers else 0
-            except:
-                continue
+        # Nothing visible yet, or no script support: wait on each locator over the wire
+        for locator in locators:
+            count_text = self._visible_text(locator, timeout=2)
+            if count_text is not None:
+                self._locator_hits[locator] += 1
+                # Extract number from text
+                match = _CART_DIGITS.search(count_text)
+                return int(match.group()) if match else 0
         
         return 0
     
+    def run_all_validations(self, factory, base_url, test_url, max_workers=_VALIDATION_WORKERS):
+        """
+        Run every bug validation in parallel, one browser session per bug.
+        
+        Args:
+            factory: Callable returning a new WebDriver instance
+            base_url: Base product URL without parameters
+            test_url: Product URL with the popup parameters
+            max_workers: Maximum number of concurrent browser sessions
+            
+        Returns:
+            Dictionary with the merged bug reproduction results
+        """
+        def run(validation):
+            driver = factory()
+            try:
+                manager = DataManager(driver)
+                popup_page = PopupPage(driver)
+                product_page = ProductPage(driver)
+                if validation == "BUG001":
+                    manager.validate_bug_001_url_dependency(base_url, test_url)
+                    return manager.bug_reproductions
+                product_page.navigate_to_product_page(test_url)
+                if validation == "BUG002":
+                    manager.validate_bug_002_add_to_cart(popup_page)
+                elif validation == "BUG006":
+                    manager.validate_bug_006_performance(popup_page)
+                elif validation == "BUG007":
+                    manager.validate_bug_007_content_mapping(popup_page, product_page)
+                elif validation == "BUG008":
+                    manager.validate_bug_008_close_functionality(popup_page)
+                return manager.bug_reproductions
+            finally:
+                driver.quit()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run, bug_id) for bug_id in _PARALLEL_VALIDATIONS]
+            for future in as_completed(futures):
+                self.bug_reproductions.update(future.result())
+        
+        return self.bug_reproductions
+    
     def generate_bug_reproduction_report(self):
         """
         Generate a comprehensive bug reproduction report.
@@ -454,11 +716,15 @@ class DataManager:
         Returns:
             Dictionary with all bug reproduction results
         """
+        total_bugs = len(self.bug_reproductions)
+        # Booleans count as 0/1, so one pass gives both totals
+        bugs_reproduced = sum(bug["reproduced"] for bug in self.bug_reproductions.values())
+        
         report = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "total_bugs_tested": len(self.bug_reproductions),
-            "bugs_reproduced": sum(1 for bug in self.bug_reproductions.values() if bug["reproduced"]),
-            "bugs_fixed": sum(1 for bug in self.bug_reproductions.values() if not bug["reproduced"]),
+            "total_bugs_tested": total_bugs,
+            "bugs_reproduced": bugs_reproduced,
+            "bugs_fixed": total_bugs - bugs_reproduced,
             "performance_metrics": self.performance_metrics,
             "detailed_results": self.bug_reproductions
         }
@@ -482,21 +748,21 @@ class DataManager:
         }
         
         try:
+            # Page load, JavaScript and popup trigger checks in one round trip
+            probe = self.driver.execute_script(_COMPATIBILITY_PROBE_SCRIPT, _SHOW_INSTANTLY_LOCATOR[1]) or {}
+            
             # Test basic page load
-            current_url = self.driver.current_url
-            if not current_url:
+            if not probe.get("url"):
                 results["compatible"] = False
                 results["issues"].append("Page failed to load")
             
             # Test JavaScript functionality
-            js_test = self.execute_javascript("return typeof document !== 'undefined';")
-            if not js_test:
+            if not probe.get("jsOk"):
                 results["compatible"] = False
                 results["issues"].append("JavaScript not working")
             
-            # Test popup trigger availability
-            show_button_present = self.is_element_present((By.XPATH, "//button[contains(text(), 'SHOW INSTANTLY')]"))
-            if not show_button_present:
+            # Test popup trigger availability, as rendered right now
+            if not probe.get("hasTrigger"):
                 results["compatible"] = False
                 results["issues"].append("Popup trigger not available")
             
@@ -6,17 +6,210 @@ Handles popup/modal interactions with enhanced error handling, validation, and l
 import sys
 import os
 import re
+import json
+import string
+import time
+from array import array
+from functools import lru_cache
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from pages.base_page import BasePage, ElementLocator, ElementNotFoundException, ElementInteractionException
 
 # Fix import path for direct script execution
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Email format accepted by the signup form
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# The same format as character sets for the local part, host and top-level domain
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_HOST_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+
+# Visibility, title and content of the popup container, read in one call
+_POPUP_CONTENT_FUNCTION = """
+function (selector) {
+    var popup = document.querySelector(selector);
+    if (!popup) {
+        return {visible: false, title: '', content: ''};
+    }
+    var title = popup.querySelector('h1, h2, h3');
+    var content = popup.querySelector('.content');
+    return {
+        visible: popup.getClientRects().length > 0,
+        title: title ? title.innerText : '',
+        content: content ? content.innerText : ''
+    };
+}
+""".strip()
+# The same read as a WebDriver script taking the container selector as its argument
+_POPUP_CONTENT_SCRIPT = "return (%s)(arguments[0]);" % _POPUP_CONTENT_FUNCTION
+
+# Clicks whatever sits just inside the bottom-right corner of the viewport
+_CLICK_VIEWPORT_CORNER_SCRIPT = """
+var element = document.elementFromPoint(window.innerWidth - 10, window.innerHeight - 10);
+if (element) {
+    element.click();
+}
+return !!element;
+"""
+
+# Clicks a target and resolves once the popup reaches the wanted visibility, or after the timeout.
+# Resolves with null if the target is missing, otherwise with the popup element when waiting for it
+# to show, true when waiting for it to hide, or false on timeout.
+_CLICK_AND_AWAIT_POPUP_SCRIPT = """
+var target = document.querySelector(arguments[0]);
+var popupSelector = arguments[1];
+var wantVisible = arguments[2];
+var timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+if (!target) {
+    done(null);
+    return;
+}
+var finished = false;
+function visiblePopup() {
+    var popup = document.querySelector(popupSelector);
+    return popup && popup.getClientRects().length ? popup : null;
+}
+function check() {
+    var popup = visiblePopup();
+    if (wantVisible ? popup : !popup) {
+        finish(wantVisible ? popup : true);
+    }
+}
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+var observer = new MutationObserver(check);
+var timer = setTimeout(function () { finish(false); }, timeoutMs);
+observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+target.click();
+check();
+"""
+
+
+@lru_cache(maxsize=256)
+def _is_valid_email_cached(email: str) -> bool:
+    """Checks a stripped email against the signup format; repeated addresses hit the cache."""
+    local, at, domain = email.partition('@')
+    host, dot, tld = domain.rpartition('.')
+    return bool(
+        at and local and host and dot and len(tld) >= 2
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_HOST_CHARS.issuperset(host)
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+    )
+
+
+# Number of recent state update timestamps kept per page
+POPUP_STATE_HISTORY = 256
+
+# Failure reasons recorded in the popup state, interned once and shared by every update
+_REASON_TIMEOUT = sys.intern("timeout")
+_REASON_NO_CLOSE_BUTTON = sys.intern("no_close_button")
+_REASON_POPUP_NOT_VISIBLE = sys.intern("popup_not_visible")
+_REASON_POPUP_STILL_VISIBLE = sys.intern("popup_still_visible")
+_REASON_INVALID_EMAIL = sys.intern("invalid_email")
+_REASON_POPUP_NOT_APPEARED = sys.intern("popup_not_appeared")
+_REASON_EMAIL_ENTRY_FAILED = sys.intern("email_entry_failed")
+_REASON_SUBMIT_CLICK_FAILED = sys.intern("submit_click_failed")
+
+# Action-specific details kept by PopupStateTracker, in the order get_popup_state reports them
+_POPUP_STATE_DETAILS = ('reason', 'error', 'email', 'method')
+
+
+class PopupStateTracker:
+    """
+    Fixed-layout popup state with a ring buffer of recent update timestamps.
+    Updates are attribute writes; the dictionary view is only built on request.
+    """
+
+    __slots__ = ('is_visible', 'last_action', 'last_success', 'timestamp', 'error_count',
+                 'reason', 'error', 'email', 'method', 'timings', 'timings_idx')
+
+    def __init__(self):
+        self.is_visible = False
+        self.last_action: Optional[str] = None
+        self.last_success: Optional[bool] = None
+        self.timestamp: Optional[float] = None
+        self.error_count = 0
+        # Action-specific details; each keeps its last value until overwritten
+        self.reason: Optional[str] = None
+        self.error: Optional[str] = None
+        self.email: Optional[str] = None
+        self.method: Optional[str] = None
+        self.timings = array('d', bytes(8 * POPUP_STATE_HISTORY))
+        self.timings_idx = 0
+
+    def record(self, action: str, success: bool, is_visible: Optional[bool] = None,
+               reason: Optional[str] = None, error: Optional[str] = None,
+               email: Optional[str] = None, method: Optional[str] = None):
+        """
+        Record the outcome of a popup action.
+
+        Args:
+            action: The action that was performed.
+            success: Whether the action was successful.
+            is_visible: Popup visibility, when the action observed it.
+            reason: Why the action failed, one of the module's _REASON_* constants.
+            error: Message of the exception that made the action fail.
+            email: Email address the action used.
+            method: How the action was carried out.
+        """
+        now = time.time()
+        self.last_action = action
+        self.last_success = success
+        self.timestamp = now
+        self.timings[self.timings_idx % POPUP_STATE_HISTORY] = now
+        self.timings_idx += 1
+        if is_visible is not None:
+            self.is_visible = is_visible
+        if reason is not None:
+            self.reason = reason
+        if error is not None:
+            self.error = error
+        if email is not None:
+            self.email = email
+        if method is not None:
+            self.method = method
+        if not success:
+            self.error_count += 1
+
+    def recent_timestamps(self) -> List[float]:
+        """Timestamps of the most recent updates, oldest first."""
+        if self.timings_idx <= POPUP_STATE_HISTORY:
+            return self.timings[:self.timings_idx].tolist()
+        start = self.timings_idx % POPUP_STATE_HISTORY
+        return (self.timings[start:] + self.timings[:start]).tolist()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Build the dictionary form returned by PopupPage.get_popup_state."""
+        state = {
+            'is_visible': self.is_visible,
+            'last_action': self.last_action,
+            'performance_metrics': {'recent_update_timestamps': self.recent_timestamps()},
+            'error_count': self.error_count,
+        }
+        if self.timestamp is not None:
+            state['last_success'] = self.last_success
+            state['timestamp'] = self.timestamp
+        for name in _POPUP_STATE_DETAILS:
+            value = getattr(self, name)
+            if value is not None:
+                state[name] = value
+        return state
+
 
 class PopupPage(BasePage):
     """
@@ -27,7 +220,7 @@ class PopupPage(BasePage):
     # Enhanced locators with multiple strategies and descriptions
     POPUP_CONTAINER = ElementLocator(
         By.CSS_SELECTOR, ".popup, .modal, [role='dialog'], [aria-modal='true']",
-        "Main popup/modal container"
+        "Main popup/modal container", primary="[role='dialog']"
     )
     EMAIL_INPUT = ElementLocator(
         By.CSS_SELECTOR, ".popup input[type='email'], .modal input[type='email'], [data-testid='email-input']",
@@ -42,6 +235,10 @@ class PopupPage(BasePage):
         "Close button in popup"
     )
 
+    # The same fields relative to an already located popup container
+    EMAIL_INPUT_IN_POPUP = "input[type='email'], [data-testid='email-input']"
+    SUBMIT_BUTTON_IN_POPUP = "button[type='submit'], [data-testid='submit-btn']"
+
     # Additional locators for comprehensive popup handling
     SHOW_INSTANTLY_BUTTON = ElementLocator(
         By.CSS_SELECTOR, ".btn-show-instantly", "Show instantly trigger button"
@@ -59,6 +256,9 @@ class PopupPage(BasePage):
         "Popup backdrop/overlay"
     )
 
+    # Popup content read as a self-contained expression for CDP Runtime.evaluate
+    _POPUP_CONTENT_EXPRESSION = "(%s)(%s)" % (_POPUP_CONTENT_FUNCTION, json.dumps(POPUP_CONTAINER.value))
+
     def __init__(self, driver: WebDriver):
         """
         Initialize the PopupPage with a WebDriver instance.
@@ -67,38 +267,52 @@ class PopupPage(BasePage):
             driver: WebDriver instance for browser interaction.
         """
         super().__init__(driver)
-        self.logger = logging.getLogger(self.__class__.__name__)
 
         # Popup state tracking
-        self._popup_state: Dict[str, Any] = {
-            'is_visible': False,
-            'last_action': None,
-            'performance_metrics': {},
-            'error_count': 0
-        }
+        self._popup_state = PopupStateTracker()
+        # Container resolved by the last successful wait_for_popup_to_appear
+        self._popup_element: Optional[WebElement] = None
 
-    def _update_popup_state(self, action: str, success: bool, **kwargs):
+    def _update_popup_state(self, action: str, success: bool, is_visible: Optional[bool] = None,
+                            reason: Optional[str] = None, error: Optional[str] = None,
+                            email: Optional[str] = None, method: Optional[str] = None):
         """
         Update the internal popup state tracking.
 
         Args:
             action: The action that was performed.
             success: Whether the action was successful.
-            **kwargs: Additional state information.
+            is_visible, reason, error, email, method: Action details, see PopupStateTracker.record.
         """
-        self._popup_state.update({
-            'last_action': action,
-            'last_success': success,
-            'timestamp': __import__('time').time(),
-            **kwargs
-        })
-
-        if not success:
-            self._popup_state['error_count'] += 1
+        self._popup_state.record(action, success, is_visible, reason, error, email, method)
 
     def get_popup_state(self) -> Dict[str, Any]:
         """Get the current popup state information."""
-        return self._popup_state.copy()
+        return self._popup_state.as_dict()
+
+    @property
+    def popup_element(self) -> Optional[WebElement]:
+        """The popup container found by the last successful wait_for_popup_to_appear, if any."""
+        return self._popup_element
+
+    def _find_in_popup(self, selector: str) -> Optional[WebElement]:
+        """
+        Find a visible child of the cached popup container without a page-wide lookup.
+
+        Args:
+            selector: CSS selector relative to the popup container.
+
+        Returns:
+            The element, or None if there is no usable cached container or no visible match.
+        """
+        if self._popup_element is None:
+            return None
+        try:
+            element = self._popup_element.find_element(By.CSS_SELECTOR, selector)
+            return element if element.is_displayed() else None
+        except WebDriverException:
+            # Missing child or stale container; callers fall back to a page-wide lookup
+            return None
 
     def is_popup_visible(self, timeout: Optional[int] = None) -> bool:
         """
@@ -117,7 +331,7 @@ class PopupPage(BasePage):
                 self._update_popup_state('check_visibility', True, is_visible=is_visible)
                 return is_visible
             except Exception as e:
-                self.logger.error(f"Error checking popup visibility: {e}")
+                self.logger.error("Error checking popup visibility: %s", e)
                 self._update_popup_state('check_visibility', False, error=str(e))
                 return False
 
@@ -131,21 +345,29 @@ class PopupPage(BasePage):
         Returns:
             bool: True if popup appeared, False otherwise.
         """
+        log_info = self.logger.info
+        log_warning = self.logger.warning
+        log_error = self.logger.error
         with self.performance_context("wait_for_popup"):
-            self.logger.info(f"Waiting for popup to appear within {timeout} seconds")
+            log_info("Waiting for popup to appear within %s seconds", timeout)
             try:
-                # Use the base class method for consistency
-                popup_visible = self.is_element_visible(self.POPUP_CONTAINER, timeout)
-                if popup_visible:
+                # Keep the resolved container so later visibility checks skip the lookup
+                try:
+                    self._popup_element = self._wait_for_element(
+                        self.POPUP_CONTAINER, EC.visibility_of_element_located, timeout
+                    )
+                except TimeoutException:
+                    self._popup_element = None
+                if self._popup_element is not None:
                     self._update_popup_state('wait_appear', True)
-                    self.logger.info("Popup appeared successfully")
+                    log_info("Popup appeared successfully")
                     return True
                 else:
-                    self._update_popup_state('wait_appear', False, reason="timeout")
-                    self.logger.warning("Popup did not appear within the timeout")
+                    self._update_popup_state('wait_appear', False, reason=_REASON_TIMEOUT)
+                    log_warning("Popup did not appear within the timeout")
                     return False
             except Exception as e:
-                self.logger.error(f"Error waiting for popup to appear: {e}")
+                log_error("Error waiting for popup to appear: %s", e)
                 self._update_popup_state('wait_appear', False, error=str(e))
                 return False
 
@@ -171,13 +393,19 @@ class PopupPage(BasePage):
             raise ValueError(f"Invalid email format: {email}")
 
         with self.performance_context("enter_email"):
-            self.logger.info(f"Entering email: {email}")
+            self.logger.info("Entering email: %s", email)
             try:
-                success = self.send_keys_to_element(self.EMAIL_INPUT, email, timeout=timeout)
+                email_input = self._find_in_popup(self.EMAIL_INPUT_IN_POPUP)
+                if email_input is not None:
+                    email_input.clear()
+                    email_input.send_keys(email)
+                    success = True
+                else:
+                    success = self.send_keys_to_element(self.EMAIL_INPUT, email, timeout=timeout)
                 self._update_popup_state('enter_email', success, email=email)
                 return success
             except ElementInteractionException as e:
-                self.logger.error(f"Failed to enter email: {e}")
+                self.logger.error("Failed to enter email: %s", e)
                 self._update_popup_state('enter_email', False, error=str(e))
                 raise
 
@@ -197,17 +425,47 @@ class PopupPage(BasePage):
         with self.performance_context("click_submit"):
             self.logger.info("Clicking submit button")
             try:
-                success = self.click_element(self.SUBMIT_BUTTON, timeout=timeout)
+                submit_button = self._find_in_popup(self.SUBMIT_BUTTON_IN_POPUP)
+                if submit_button is not None:
+                    submit_button.click()
+                    success = True
+                else:
+                    success = self.click_element(self.SUBMIT_BUTTON, timeout=timeout)
                 self._update_popup_state('click_submit', success)
                 return success
             except ElementInteractionException as e:
-                self.logger.error(f"Failed to click submit button: {e}")
+                self.logger.error("Failed to click submit button: %s", e)
                 self._update_popup_state('click_submit', False, error=str(e))
                 raise
 
+    def _click_if_present(self, locator: ElementLocator, timeout: Optional[int] = None) -> bool:
+        """
+        Click an element if it is in the DOM, finding it with a single lookup.
+
+        Args:
+            locator: Element to click.
+            timeout: Custom timeout for waiting until a present element is clickable.
+
+        Returns:
+            bool: True if the element was clicked, False if it is not present.
+
+        Raises:
+            ElementInteractionException: If the element is present but cannot be clicked.
+        """
+        elements = self.driver.find_elements(*locator.to_tuple())
+        if not elements:
+            return False
+        try:
+            elements[0].click()
+        except WebDriverException:
+            # Present but not clickable yet, e.g. still animating in
+            self.click_element(locator, timeout=timeout)
+        return True
+
     def dismiss_popup(self, timeout: Optional[int] = None) -> bool:
         """
         Dismiss the popup by clicking the close button if available.
+        A single lookup both finds the close button and tells whether there is one.
 
         Args:
             timeout: Custom timeout for the operation.
@@ -218,16 +476,15 @@ class PopupPage(BasePage):
         with self.performance_context("dismiss_popup"):
             self.logger.info("Attempting to dismiss popup")
             try:
-                if self.is_element_present(self.CLOSE_BUTTON):
-                    success = self.click_element(self.CLOSE_BUTTON, timeout=timeout)
-                    self._update_popup_state('dismiss', success)
-                    return success
-                else:
+                if not self._click_if_present(self.CLOSE_BUTTON, timeout):
                     self.logger.warning("Close button not found")
-                    self._update_popup_state('dismiss', False, reason="no_close_button")
+                    self._update_popup_state('dismiss', False, reason=_REASON_NO_CLOSE_BUTTON)
                     return False
+                self._popup_element = None
+                self._update_popup_state('dismiss', True)
+                return True
             except ElementInteractionException as e:
-                self.logger.error(f"Failed to dismiss popup: {e}")
+                self.logger.error("Failed to dismiss popup: %s", e)
                 self._update_popup_state('dismiss', False, error=str(e))
                 return False
 
@@ -248,10 +505,29 @@ class PopupPage(BasePage):
                 self._update_popup_state('trigger_popup', success)
                 return success
             except ElementInteractionException as e:
-                self.logger.error(f"Failed to click 'SHOW INSTANTLY' button: {e}")
+                self.logger.error("Failed to click 'SHOW INSTANTLY' button: %s", e)
                 self._update_popup_state('trigger_popup', False, error=str(e))
                 return False
 
+    def _popup_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Read popup visibility, title and content in one round trip.
+        Chromium drivers evaluate over CDP; others run the same function as a WebDriver script.
+
+        Returns:
+            Dict with 'visible', 'title' and 'content', or None if neither path worked.
+        """
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            try:
+                return self._cdp_eval(self._POPUP_CONTENT_EXPRESSION)
+            except WebDriverException as e:
+                self.logger.debug("CDP popup read failed, using a WebDriver script: %s", e)
+        try:
+            return self.driver.execute_script(_POPUP_CONTENT_SCRIPT, self.POPUP_CONTAINER.value)
+        except WebDriverException as e:
+            self.logger.debug("Popup content script failed, reading elements one by one: %s", e)
+            return None
+
     def get_popup_content_text(self, timeout: Optional[int] = None) -> str:
         """
         Get the text content of the popup.
@@ -264,12 +540,16 @@ class PopupPage(BasePage):
         """
         with self.performance_context("get_popup_content"):
             self.logger.info("Getting popup content text")
+            snapshot = self._popup_snapshot()
+            if snapshot is not None and snapshot['visible']:
+                return snapshot['content']
             try:
                 content = self.get_element_text(self.POPUP_CONTENT, timeout=timeout)
-                self.logger.debug(f"Popup content retrieved (length: {len(content)})")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Popup content retrieved (length: %s)", len(content))
                 return content
             except ElementInteractionException as e:
-                self.logger.error(f"Failed to get popup content: {e}")
+                self.logger.error("Failed to get popup content: %s", e)
                 return ""
 
     def get_popup_title(self, timeout: Optional[int] = None) -> str:
@@ -284,14 +564,44 @@ class PopupPage(BasePage):
         """
         with self.performance_context("get_popup_title"):
             self.logger.info("Getting popup title")
+            snapshot = self._popup_snapshot()
+            if snapshot is not None and snapshot['visible']:
+                self.logger.debug("Popup title: %s", snapshot['title'])
+                return snapshot['title']
             try:
                 title = self.get_element_text(self.POPUP_TITLE, timeout=timeout)
-                self.logger.debug(f"Popup title: {title}")
+                self.logger.debug("Popup title: %s", title)
                 return title
             except ElementInteractionException as e:
-                self.logger.error(f"Failed to get popup title: {e}")
+                self.logger.error("Failed to get popup title: %s", e)
                 return ""
 
+    def _click_and_await_popup(self, target: ElementLocator, visible: bool,
+                               timeout: Optional[int] = None) -> Union[WebElement, bool, None]:
+        """
+        Click a target and wait for the popup to show or hide, all inside the browser.
+
+        Args:
+            target: Element to click.
+            visible: True to wait for the popup to appear, False to wait for it to disappear.
+            timeout: Custom timeout in seconds. Uses default if None.
+
+        Returns:
+            The popup element once it appears (or True once it disappears), False on timeout,
+            or None if the click could not be done in the browser.
+        """
+        timeout_ms = int((timeout or self.default_timeout) * 1000)
+        try:
+            return self.driver.execute_async_script(
+                _CLICK_AND_AWAIT_POPUP_SCRIPT, target.value, self.POPUP_CONTAINER.value, visible, timeout_ms
+            )
+        except TimeoutException:
+            # The click went through but the driver's script timeout ran out first
+            return False
+        except WebDriverException as e:
+            self.logger.debug("In-browser click and wait unavailable: %s", e)
+            return None
+
     def trigger_popup_and_verify(self, timeout: Optional[int] = None) -> bool:
         """
         Trigger the popup by clicking 'SHOW INSTANTLY' and verify it appears.
@@ -302,30 +612,38 @@ class PopupPage(BasePage):
         Returns:
             bool: True if popup was triggered and is visible, False otherwise.
         """
+        log_info = self.logger.info
+        log_error = self.logger.error
         with self.performance_context("trigger_and_verify"):
-            self.logger.info("Triggering popup and verifying appearance")
+            log_info("Triggering popup and verifying appearance")
             try:
-                # Click the trigger button
-                if not self.click_show_instantly_button(timeout=timeout):
-                    self.logger.error("Failed to click trigger button")
-                    return False
+                # Click the trigger and wait for the popup in one round trip
+                outcome = self._click_and_await_popup(self.SHOW_INSTANTLY_BUTTON, True, timeout)
+                if isinstance(outcome, WebElement):
+                    self._popup_element = outcome
+                if outcome is not None:
+                    popup_visible = bool(outcome)
+                else:
+                    # Trigger not rendered yet: click it through WebDriver instead
+                    if not self.click_show_instantly_button(timeout=timeout):
+                        log_error("Failed to click trigger button")
+                        return False
 
-                # Wait a moment for popup to appear
-                import time
-                time.sleep(0.5)
+                    # Wait for the popup itself rather than a fixed delay
+                    popup_visible = self.wait_for_popup_to_appear(timeout or self.default_timeout)
 
                 # Verify popup is visible
-                if self.is_popup_visible(timeout=timeout):
+                if popup_visible:
                     self._update_popup_state('trigger_verify', True)
-                    self.logger.info("Popup triggered and verified successfully")
+                    log_info("Popup triggered and verified successfully")
                     return True
                 else:
-                    self._update_popup_state('trigger_verify', False, reason="popup_not_visible")
-                    self.logger.error("Popup was triggered but not visible")
+                    self._update_popup_state('trigger_verify', False, reason=_REASON_POPUP_NOT_VISIBLE)
+                    log_error("Popup was triggered but not visible")
                     return False
 
             except Exception as e:
-                self.logger.error(f"Error triggering and verifying popup: {e}")
+                log_error("Error triggering and verifying popup: %s", e)
                 self._update_popup_state('trigger_verify', False, error=str(e))
                 return False
 
@@ -346,7 +664,7 @@ class PopupPage(BasePage):
                 self._update_popup_state('click_close', success)
                 return success
             except ElementInteractionException as e:
-                self.logger.error(f"Failed to click close button: {e}")
+                self.logger.error("Failed to click close button: %s", e)
                 self._update_popup_state('click_close', False, error=str(e))
                 return False
 
@@ -360,30 +678,37 @@ class PopupPage(BasePage):
         Returns:
             bool: True if popup was closed and is no longer visible, False otherwise.
         """
+        log_info = self.logger.info
+        log_error = self.logger.error
         with self.performance_context("close_and_verify"):
-            self.logger.info("Closing popup and verifying disappearance")
+            log_info("Closing popup and verifying disappearance")
             try:
-                # Click close button
-                if not self.click_close_button(timeout=timeout):
-                    self.logger.error("Failed to click close button")
-                    return False
+                # Click close and wait for the popup to go away in one round trip
+                outcome = self._click_and_await_popup(self.CLOSE_BUTTON, False, timeout)
+                if outcome is not None:
+                    popup_closed = bool(outcome)
+                else:
+                    # Close button not rendered yet: click it through WebDriver instead
+                    if not self.click_close_button(timeout=timeout):
+                        log_error("Failed to click close button")
+                        return False
 
-                # Wait a moment for popup to disappear
-                import time
-                time.sleep(0.5)
+                    # Wait for the popup to go away rather than a fixed delay
+                    popup_closed = self.wait_for_element_to_disappear(self.POPUP_CONTAINER, timeout)
 
                 # Verify popup is no longer visible
-                if not self.is_popup_visible(timeout=timeout):
+                if popup_closed:
+                    self._popup_element = None
                     self._update_popup_state('close_verify', True)
-                    self.logger.info("Popup closed and verified successfully")
+                    log_info("Popup closed and verified successfully")
                     return True
                 else:
-                    self._update_popup_state('close_verify', False, reason="popup_still_visible")
-                    self.logger.error("Popup close button clicked but popup still visible")
+                    self._update_popup_state('close_verify', False, reason=_REASON_POPUP_STILL_VISIBLE)
+                    log_error("Popup close button clicked but popup still visible")
                     return False
 
             except Exception as e:
-                self.logger.error(f"Error closing and verifying popup: {e}")
+                log_error("Error closing and verifying popup: %s", e)
                 self._update_popup_state('close_verify', False, error=str(e))
                 return False
 
@@ -397,25 +722,28 @@ class PopupPage(BasePage):
         Returns:
             bool: True if outside click was performed successfully, False otherwise.
         """
+        log_info = self.logger.info
+        log_warning = self.logger.warning
+        log_error = self.logger.error
         with self.performance_context("click_outside"):
-            self.logger.info("Attempting to click outside popup")
+            log_info("Attempting to click outside popup")
             try:
                 # Try to click on the overlay/backdrop
-                if self.is_element_present(self.OVERLAY_BACKDROP):
-                    success = self.click_element(self.OVERLAY_BACKDROP, timeout=timeout)
-                    self._update_popup_state('click_outside', success)
-                    return success
-                else:
-                    # Fallback: click at a specific coordinate outside popup
-                    viewport_size = self.driver.get_window_size()
-                    # Click at bottom-right corner (assuming popup is centered)
-                    self.driver.execute_script(f"document.elementFromPoint({viewport_size['width'] - 10}, {viewport_size['height'] - 10}).click();")
-                    self._update_popup_state('click_outside', True, method="coordinates")
-                    self.logger.info("Clicked outside popup using coordinates")
+                if self._click_if_present(self.OVERLAY_BACKDROP, timeout):
+                    self._update_popup_state('click_outside', True)
                     return True
+                else:
+                    # Fallback: click at the bottom-right corner of the viewport (assuming popup is centered)
+                    clicked = bool(self.driver.execute_script(_CLICK_VIEWPORT_CORNER_SCRIPT))
+                    self._update_popup_state('click_outside', clicked, method="coordinates")
+                    if clicked:
+                        log_info("Clicked outside popup using coordinates")
+                    else:
+                        log_warning("No element found at the viewport corner to click")
+                    return clicked
 
             except Exception as e:
-                self.logger.error(f"Failed to click outside popup: {e}")
+                log_error("Failed to click outside popup: %s", e)
                 self._update_popup_state('click_outside', False, error=str(e))
                 return False
 
@@ -426,57 +754,75 @@ class PopupPage(BasePage):
 
         Args:
             email: The email address to submit.
-            wait_for_popup: Whether to wait for popup to appear before submitting.
+            wait_for_popup: Whether to wait for popup to appear before submitting. A successful
+                wait is trusted as is; otherwise the popup is checked for visibility once.
             timeout: Custom timeout for operations.
 
         Returns:
             bool: True if form was submitted successfully, False otherwise.
         """
+        log_info = self.logger.info
+        log_error = self.logger.error
         with self.performance_context("submit_email_form"):
-            self.logger.info(f"Submitting email form for: {email}")
+            log_info("Submitting email form for: %s", email)
             try:
                 # Validate email first
                 if not self._is_valid_email(email):
-                    self.logger.error(f"Invalid email format: {email}")
-                    self._update_popup_state('submit_form', False, reason="invalid_email")
+                    log_error("Invalid email format: %s", email)
+                    self._update_popup_state('submit_form', False, reason=_REASON_INVALID_EMAIL)
                     return False
 
-                # Wait for popup if requested
-                if wait_for_popup and not self.wait_for_popup_to_appear(timeout):
-                    self.logger.error("Popup did not appear; cannot submit email form")
-                    self._update_popup_state('submit_form', False, reason="popup_not_appeared")
-                    return False
-
-                # Verify popup is visible
-                if not self.is_popup_visible(timeout):
-                    self.logger.error("Popup is not visible; cannot submit email form")
-                    self._update_popup_state('submit_form', False, reason="popup_not_visible")
+                # Wait for popup if requested, otherwise verify it is already visible
+                if wait_for_popup:
+                    if not self.wait_for_popup_to_appear(timeout):
+                        log_error("Popup did not appear; cannot submit email form")
+                        self._update_popup_state('submit_form', False, reason=_REASON_POPUP_NOT_APPEARED)
+                        return False
+                elif not self.is_popup_visible(timeout):
+                    log_error("Popup is not visible; cannot submit email form")
+                    self._update_popup_state('submit_form', False, reason=_REASON_POPUP_NOT_VISIBLE)
                     return False
 
                 # Enter email
                 if not self.enter_email(email, timeout):
-                    self.logger.error("Failed to enter email")
-                    self._update_popup_state('submit_form', False, reason="email_entry_failed")
+                    log_error("Failed to enter email")
+                    self._update_popup_state('submit_form', False, reason=_REASON_EMAIL_ENTRY_FAILED)
                     return False
 
                 # Click submit
                 if not self.click_submit_button(timeout):
-                    self.logger.error("Failed to click submit button")
-                    self._update_popup_state('submit_form', False, reason="submit_click_failed")
+                    log_error("Failed to click submit button")
+                    self._update_popup_state('submit_form', False, reason=_REASON_SUBMIT_CLICK_FAILED)
                     return False
 
                 self._update_popup_state('submit_form', True, email=email)
-                self.logger.info("Email form submitted successfully")
+                log_info("Email form submitted successfully")
                 return True
 
             except Exception as e:
-                self.logger.error(f"Error submitting email form: {e}")
+                log_error("Error submitting email form: %s", e)
                 self._update_popup_state('submit_form', False, error=str(e))
                 return False
 
     def _is_valid_email(self, email: str) -> bool:
         """
-        Validate email format using comprehensive regex pattern.
+        Validate email format by splitting on '@' and the last '.' and checking
+        each part's characters; accepts exactly what _EMAIL_RE accepts.
+
+        Args:
+            email: The email string to validate.
+
+        Returns:
+            bool: True if email is valid, False otherwise.
+        """
+        if not email or not isinstance(email, str):
+            return False
+
+        return _is_valid_email_cached(email.strip())
+
+    def validate_email_strict(self, email: str) -> bool:
+        """
+        Validate email format with the full regex pattern.
 
         Args:
             email: The email string to validate.
@@ -487,9 +833,7 @@ class PopupPage(BasePage):
         if not email or not isinstance(email, str):
             return False
 
-        # More comprehensive email regex pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email.strip()))
+        return bool(_EMAIL_RE.match(email.strip()))
 
     def validate_popup_content(self, expected_elements: List[str] = None) -> Dict[str, Any]:
         """
@@ -510,18 +854,30 @@ class PopupPage(BasePage):
         }
 
         try:
-            validation_results['popup_visible'] = self.is_popup_visible()
+            # Visibility, title and content in one round trip
+            snapshot = self._popup_snapshot()
+            if snapshot is not None and snapshot['visible']:
+                validation_results['popup_visible'] = True
+                title = snapshot['title']
+                content = snapshot['content']
+            else:
+                # Not rendered yet, or no script support: wait for it and read each element
+                validation_results['popup_visible'] = self.is_popup_visible()
+                if validation_results['popup_visible']:
+                    title = self.get_popup_title()
+                    content = self.get_popup_content_text()
 
             if validation_results['popup_visible']:
-                title = self.get_popup_title()
-                content = self.get_popup_content_text()
-
                 validation_results['has_title'] = bool(title.strip())
                 validation_results['has_content'] = bool(content.strip())
 
                 if expected_elements:
+                    # Lowercase the popup text once rather than per expected element
+                    title_lower = title.lower()
+                    content_lower = content.lower()
                     for element in expected_elements:
-                        if element.lower() in title.lower() or element.lower() in content.lower():
+                        element_lower = element.lower()
+                        if element_lower in title_lower or element_lower in content_lower:
                             validation_results['expected_elements_found'].append(element)
 
                 validation_results['validation_passed'] = (
@@ -531,7 +887,7 @@ class PopupPage(BasePage):
                 )
 
         except Exception as e:
-            self.logger.error(f"Error validating popup content: {e}")
+            self.logger.error("Error validating popup content: %s", e)
             validation_results['error'] = str(e)
 
         return validation_results
\ No newline at end of file
@@ -8,21 +8,29 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import logging
 from typing import Optional
 from urllib.parse import urlparse
 
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from pages.base_page import BasePage
+from pages.base_page import BasePage, ElementLocator
+
+# Document loaded and <main> rendered; returns the main text so it can be reused, or null
+_PAGE_READY_SCRIPT = """
+var main = document.querySelector('main');
+if (document.readyState !== 'complete' || !main || main.offsetParent === null) {
+    return null;
+}
+return main.innerText;
+"""
 
 
 class ProductPage(BasePage):
     """Page object for the product page with common interactions."""
 
     # Locators
-    MAIN_CONTENT = (By.TAG_NAME, "main")
+    MAIN_CONTENT = ElementLocator(By.TAG_NAME, "main", "Main content")
 
     def __init__(self, driver: WebDriver, default_timeout: int = 15):
         """
@@ -33,7 +41,8 @@ class ProductPage(BasePage):
             default_timeout: Default timeout for waits in seconds.
         """
         super().__init__(driver, default_timeout)
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # Main text read by the last successful is_page_loaded, served once by get_main_content_text
+        self._main_content_text: Optional[str] = None
 
     def navigate_to_product_page(self, url: str) -> bool:
         """
@@ -58,15 +67,17 @@ class ProductPage(BasePage):
             if not parsed_url.scheme or not parsed_url.netloc:
                 raise ValueError("Invalid URL format")
 
-            self.logger.info(f"Navigating to product page: {url}")
+            self.logger.info("Navigating to product page: %s", url)
             self.driver.get(url)
+            self.invalidate_cache()
+            self._main_content_text = None
             self.wait_for_page_load()
             return True
         except WebDriverException as e:
-            self.logger.error(f"Failed to navigate to {url}: {e}")
+            self.logger.error("Failed to navigate to %s: %s", url, e)
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error during navigation: {e}")
+            self.logger.error("Unexpected error during navigation: %s", e)
             return False
 
     def is_page_loaded(self) -> bool:
@@ -78,10 +89,14 @@ class ProductPage(BasePage):
         """
         try:
             self.logger.info("Checking if product page is loaded")
-            # Check if main content is visible
+            # Ready state and main content visibility in one round trip
+            self._main_content_text = self.driver.execute_script(_PAGE_READY_SCRIPT)
+            if self._main_content_text is not None:
+                return True
+            # Not rendered yet: wait for the main content as before
             return self.is_element_visible(self.MAIN_CONTENT)
         except Exception as e:
-            self.logger.error(f"Error checking page load status: {e}")
+            self.logger.error("Error checking page load status: %s", e)
             return False
 
     def get_main_content_text(self) -> Optional[str]:
@@ -91,8 +106,11 @@ class ProductPage(BasePage):
         Returns:
             The text content of the main element, or None if not found.
         """
+        if self._main_content_text is not None:
+            text, self._main_content_text = self._main_content_text, None
+            return text
         try:
             return self.get_element_text(self.MAIN_CONTENT)
         except Exception as e:
-            self.logger.error(f"Failed to get main content text: {e}")
+            self.logger.error("Failed to get main content text: %s", e)
             return None
\ No newline at end of file
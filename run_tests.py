@@ -4,21 +4,302 @@ Test Execution Script for Insider Test Automation Project
 Provides comprehensive test execution with advanced reporting and bug validation.
 """
 
+import io
 import os
 import sys
+import html
 import json
+import multiprocessing
+import string
 import time
 import argparse
 from datetime import datetime
 from pathlib import Path
 import subprocess
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; reports are parsed with the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; large reports are then loaded in full
+    ijson = None
+
+# Maximum duration of one pytest run, in seconds
+PYTEST_TIMEOUT = 1800
+
+# JSON reports above this size are streamed for their summary instead of loaded whole
+LARGE_REPORT_BYTES = 5 * 1024 * 1024
+
+# Output directories created by setup_environment
+_REPORT_DIRECTORIES = (
+    "reports/html",
+    "reports/json",
+    "screenshots/failed",
+    "screenshots/passed",
+    "screenshots/evidence",
+)
+# Set once _REPORT_DIRECTORIES exist, so later executors skip the filesystem calls
+_DIRS_READY = False
+
+# Test module each suite runs on its own, so a batched run attributes tests the same way
+_BATCHED_SUITE_MODULES = {
+    "critical": "tests/popup/test_popup_functionality.py",
+    "performance": "tests/mobile/test_performance_responsive.py",
+    "mobile": "tests/mobile/test_performance_responsive.py",
+    "cross_browser": "tests/cross_browser/test_cross_browser.py",
+}
+
+# Modules the fork server imports once for every pytest run: pytest, Selenium and the
+# pytest plugins each run loads. The page objects are left out because importing them
+# starts the logging listener thread, which forked children would not inherit.
+_PYTEST_PRELOAD = [
+    "pytest",
+    "selenium.webdriver",
+    "pytest_html",
+    "pytest_jsonreport.plugin",
+    "xdist.plugin",
+]
+
+# pytest runs in a child process forked from a server that has already imported
+# _PYTEST_PRELOAD, so each run skips interpreter start-up and those imports
+if "forkserver" in multiprocessing.get_all_start_methods():
+    import multiprocessing.forkserver
+    _MP_CONTEXT = multiprocessing.get_context("forkserver")
+    _MP_CONTEXT.set_forkserver_preload(_PYTEST_PRELOAD)
+else:
+    _MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _pytest_main_captured(args):
+    """Run pytest.main in this process, returning (exit code, stdout, stderr)."""
+    import pytest
+    
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            exit_code = int(pytest.main(args))
+    except Exception as e:
+        stderr.write(f"pytest.main failed: {e!r}\n")
+        exit_code = -1
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def _run_pytest_main(args, conn):
+    """Child process entry point: run pytest in-process and send back (exit code, stdout, stderr)."""
+    conn.send(_pytest_main_captured(args))
+    conn.close()
+
+
+def _run_pytest_in_process(cmd, timeout):
+    """
+    Run a ``pytest ...`` command through pytest.main in a child process.
+    Returns a CompletedProcess like subprocess.run and raises subprocess.TimeoutExpired
+    after timeout seconds, killing the child.
+    """
+    receiver, sender = _MP_CONTEXT.Pipe(duplex=False)
+    process = _MP_CONTEXT.Process(target=_run_pytest_main, args=(cmd[1:], sender), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        # Read before joining: a large report would otherwise block the child on a full pipe
+        if not receiver.poll(timeout):
+            process.kill()
+            process.join()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        try:
+            exit_code, stdout, stderr = receiver.recv()
+        except EOFError:
+            # The child died before reporting, e.g. killed by a signal
+            process.join()
+            return subprocess.CompletedProcess(cmd, process.exitcode, "", "pytest process exited unexpectedly")
+        process.join()
+        return subprocess.CompletedProcess(cmd, exit_code, stdout, stderr)
+    finally:
+        receiver.close()
+
+
+# Static skeleton of the HTML execution summary; ${suite_results} is built per run
+_HTML_TEMPLATE = string.Template("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Insider Test Automation - Execution Summary</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .header { text-align: center; margin-bottom: 30px; }
+        .status-not-ready { color: #d32f2f; font-weight: bold; font-size: 24px; }
+        .section { margin: 20px 0; padding: 15px; border-left: 4px solid #2196F3; background: #f8f9fa; }
+        .critical { border-left-color: #f44336; }
+        .warning { border-left-color: #ff9800; }
+        .success { border-left-color: #4caf50; }
+        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }
+        .stat-card { background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); text-align: center; }
+        .bug-list { list-style: none; padding: 0; }
+        .bug-item { background: #ffebee; margin: 5px 0; padding: 10px; border-radius: 4px; border-left: 4px solid #f44336; }
+        table { width: 100%; border-collapse: collapse; margin: 15px 0; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #f5f5f5; font-weight: bold; }
+        .footer { text-align: center; margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Insider Test Automation Report</h1>
+            <p><strong>Onsite Experiment Pop-up Campaign</strong></p>
+            <p>Generated: ${timestamp}</p>
+            <div class="status-not-ready">PRODUCTION STATUS: NOT READY</div>
+        </div>
+
+        <div class="section critical">
+            <h2>Manual vs Automated Test Comparison</h2>
+            <div class="stats-grid">
+                <div class="stat-card">
+                    <h3>Manual Testing</h3>
+                    <p><strong>Success Rate: 22.9%</strong></p>
+                    <p>8/35 tests passed</p>
+                </div>
+                <div class="stat-card">
+                    <h3>Automated Validation</h3>
+                    <p><strong>Bug Reproduction: Expected</strong></p>
+                    <p>Critical bugs confirmed</p>
+                </div>
+            </div>
+        </div>
+
+${suite_results}
+        <div class="section critical">
+            <h2>Critical Production Blockers</h2>
+            <ul class="bug-list">
+                <li class="bug-item"><strong>BUG001:</strong> URL parameter dependency - System unusable</li>
+                <li class="bug-item"><strong>BUG002:</strong> Add to Cart not working - Revenue impact</li>
+                <li class="bug-item"><strong>BUG004:</strong> Mobile 0% functionality - 60%+ users affected</li>
+                <li class="bug-item"><strong>BUG005:</strong> Firefox/Safari failure - 40%+ browsers affected</li>
+                <li class="bug-item"><strong>BUG007:</strong> 90% incorrect product mapping - Customer confusion</li>
+            </ul>
+        </div>
+
+        <div class="section warning">
+            <h2>High Priority Issues</h2>
+            <ul>
+                <li><strong>BUG006:</strong> Performance 4.49s delay (>2s standard)</li>
+                <li><strong>BUG008:</strong> Close buttons not working</li>
+                <li><strong>BUG009:</strong> Memory leak detected</li>
+                <li><strong>BUG010:</strong> Background overlay missing</li>
+            </ul>
+        </div>
+
+        <div class="section">
+            <h2>Minimum Requirements for Production</h2>
+            <table>
+                <tr><th>Requirement</th><th>Current Status</th><th>Target</th></tr>
+                <tr><td>Add to Cart Functionality</td><td>Broken</td><td>100% Working</td></tr>
+                <tr><td>Mobile Compatibility</td><td>0% Functional</td><td>>95% Functional</td></tr>
+                <tr><td>Cross-Browser Support</td><td>Chrome Only (Partial)</td><td>Chrome, Firefox, Safari</td></tr>
+                <tr><td>Performance</td><td>4.49s Load Time</td><td><2s Load Time</td></tr>
+                <tr><td>Content Accuracy</td><td>10% Correct</td><td>>95% Correct</td></tr>
+            </table>
+        </div>
+
+        <div class="section">
+            <h2>Recommendations</h2>
+            <ol>
+                <li><strong>Immediate Action:</strong> Stop any production deployment plans</li>
+                <li><strong>Critical Fixes:</strong> Address all P1 bugs (BUG001, BUG002, BUG004, BUG005, BUG007)</li>
+                <li><strong>Cross-Browser Testing:</strong> Implement comprehensive browser compatibility</li>
+                <li><strong>Mobile Development:</strong> Complete responsive design implementation</li>
+                <li><strong>Performance Optimization:</strong> Reduce load times to <2 seconds</li>
+                <li><strong>Content Validation:</strong> Fix product mapping accuracy to >95%</li>
+            </ol>
+        </div>
+
+        <div class="section">
+            <h2>Estimated Timeline</h2>
+            <p><strong>Production Readiness:</strong> 6-8 weeks with dedicated development team</p>
+            <ul>
+                <li><strong>Week 1-2:</strong> Critical bug fixes (BUG001, BUG002, BUG007)</li>
+                <li><strong>Week 3-4:</strong> Cross-browser compatibility (BUG005)</li>
+                <li><strong>Week 5-6:</strong> Mobile responsiveness (BUG004)</li>
+                <li><strong>Week 7-8:</strong> Performance optimization and final testing</li>
+            </ul>
+        </div>
+
+        <div class="footer">
+            <p>This report is based on comprehensive manual testing findings and automated validation.</p>
+            <p><strong>Conclusion:</strong> The system is not suitable for production deployment in its current state.</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+def _load_json_report(path):
+    """
+    Read the summary and tests of a pytest-json-report file.
+    Large reports only have their summary parsed when ijson is installed; the tests
+    are then left on disk and referenced by path under "tests_report".
+    """
+    if ijson is not None and os.path.getsize(path) > LARGE_REPORT_BYTES:
+        with open(path, 'rb') as f:
+            # pytest-json-report writes the summary before the tests, so parsing stops early
+            summary = next(ijson.items(f, "summary"), {})
+        return {"summary": summary, "tests_report": path}
+    with open(path, 'rb') as f:
+        json_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    return {"summary": json_data.get("summary", {}), "tests": json_data.get("tests", [])}
+
+
+def _iter_report_tests(path):
+    """Yield the test entries of a pytest-json-report file, streaming them when ijson is installed."""
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, "tests.item")
+        else:
+            json_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+            yield from json_data.get("tests", [])
+
+
+def _test_markers(test):
+    """
+    Marker names of a pytest-json-report test entry, as recorded by conftest.py.
+    The report's keywords cannot be used: they also hold the nodeid's directory names,
+    so every test under tests/mobile/ would look marked "mobile".
+    """
+    return test.get("metadata", {}).get("markers", ())
+
+
+def _report_paths(name):
+    """HTML and JSON report paths for a pytest run named name."""
+    return f"reports/html/{name}-report.html", f"reports/json/{name}-report.json"
 
 
 class TestExecutor:
     """Main test execution controller with comprehensive reporting."""
     
-    def __init__(self):
+    def __init__(self, workers="auto"):
         self.start_time = datetime.now()
+        # Durations are measured on the monotonic clock, immune to wall-clock adjustments
+        self._start_monotonic = time.monotonic()
+        # Report generation time, read once and shared by the JSON and HTML reports
+        self._now = None
+        self._report_timestamp = None
+        # pytest-xdist worker count per pytest run ("auto" = one per CPU, 0 = serial)
+        self.workers = workers
+        # Suites may finish concurrently; guards writes to self.results
+        self._results_lock = threading.Lock()
+        # Start the fork server now so its imports overlap environment setup;
+        # it lives until this process exits and serves every suite
+        if _MP_CONTEXT.get_start_method() == "forkserver":
+            multiprocessing.forkserver.ensure_running()
         self.results = {
             "execution_info": {
                 "start_time": self.start_time.isoformat(),
@@ -53,18 +334,13 @@ class TestExecutor:
         """Setup test environment and directories."""
         print("Setting up test environment...")
         
-        # Create necessary directories
-        directories = [
-            "reports/html",
-            "reports/json", 
-            "screenshots/failed",
-            "screenshots/passed",
-            "screenshots/evidence"
-        ]
-        
-        for directory in directories:
-            Path(directory).mkdir(parents=True, exist_ok=True)
-            print(f"   Created directory: {directory}")
+        # Create necessary directories, once per process
+        global _DIRS_READY
+        if not _DIRS_READY:
+            for directory in _REPORT_DIRECTORIES:
+                os.makedirs(directory, exist_ok=True)
+            _DIRS_READY = True
+        print(f"   Created {len(_REPORT_DIRECTORIES)} directories: {', '.join(_REPORT_DIRECTORIES)}")
         
         # Verify Python dependencies
         try:
@@ -76,29 +352,44 @@ class TestExecutor:
             print(f"   Missing dependency: {e}")
             return False
         
+        # Parallel runs need pytest-xdist; without it every suite runs serially
+        try:
+            import xdist
+            print(f"   pytest-xdist available (workers: {self.workers})")
+        except ImportError:
+            print(f"   pytest-xdist not installed, running tests serially")
+            self.workers = 0
+        
         return True
     
+    def _parallel_args(self):
+        """pytest-xdist options distributing test files across workers."""
+        if str(self.workers) in ("0", "1"):
+            return []
+        return ["-n", str(self.workers), "--dist", "loadfile"]
+    
     def run_critical_tests(self, browser="chrome", headless=True):
         """Run critical priority tests."""
         print(f"\nRunning Critical Tests (Browser: {browser})")
         
+        html_path, json_path = _report_paths("critical")
         cmd = [
             "pytest",
             "tests/popup/test_popup_functionality.py",
             f"--browser={browser}",
             "-m", "critical",
-            "--html=reports/html/critical-report.html",
+            f"--html={html_path}",
             "--self-contained-html",
             "--json-report",
-            "--json-report-file=reports/json/critical-report.json",
+            f"--json-report-file={json_path}",
             "-v"
         ]
         
         if headless:
             cmd.append("--headless")
         
-        result = self._execute_pytest_command(cmd, "critical")
-        self.results["test_results"]["critical"] = result
+        result = self._execute_pytest_command(cmd, "critical", json_report_path=json_path)
+        self._record_result("critical", result)
         
         return result
     
@@ -109,49 +400,58 @@ class TestExecutor:
         
         print(f"\nRunning Cross-Browser Tests")
         
-        browser_results = {}
+        commands = {}
         
         for browser in browsers:
             print(f"   Testing browser: {browser}")
             
-            cmd = [
+            html_path, json_path = _report_paths(f"cross-browser-{browser}")
+            commands[browser] = (json_path, [
                 "pytest",
                 "tests/cross_browser/test_cross_browser.py",
                 f"--browser={browser}",
                 "-m", "cross_browser",
-                f"--html=reports/html/cross-browser-{browser}-report.html",
+                f"--html={html_path}",
                 "--self-contained-html",
                 "--json-report",
-                f"--json-report-file=reports/json/cross-browser-{browser}-report.json",
+                f"--json-report-file={json_path}",
                 "--headless",
                 "-v"
-            ]
-            
-            result = self._execute_pytest_command(cmd, f"cross_browser_{browser}")
-            browser_results[browser] = result
+            ])
         
-        self.results["test_results"]["cross_browser"] = browser_results
+        # Each browser is an independent pytest process, so run them side by side
+        browser_results = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(commands))) as pool:
+            futures = {
+                pool.submit(self._execute_pytest_command, cmd, f"cross_browser_{browser}", json_path): browser
+                for browser, (json_path, cmd) in commands.items()
+            }
+            for future in as_completed(futures):
+                browser_results[futures[future]] = future.result()
+        
+        self._record_result("cross_browser", browser_results)
         return browser_results
     
     def run_performance_tests(self, browser="chrome"):
         """Run performance and responsive design tests."""
         print(f"\nRunning Performance Tests (Browser: {browser})")
         
+        html_path, json_path = _report_paths("performance")
         cmd = [
             "pytest",
             "tests/mobile/test_performance_responsive.py",
             f"--browser={browser}",
             "-m", "performance",
-            "--html=reports/html/performance-report.html",
+            f"--html={html_path}",
             "--self-contained-html",
             "--json-report",
-            "--json-report-file=reports/json/performance-report.json",
+            f"--json-report-file={json_path}",
             "--headless",
             "-v"
         ]
         
-        result = self._execute_pytest_command(cmd, "performance")
-        self.results["test_results"]["performance"] = result
+        result = self._execute_pytest_command(cmd, "performance", json_report_path=json_path)
+        self._record_result("performance", result)
         
         return result
     
@@ -159,21 +459,22 @@ class TestExecutor:
         """Run mobile and responsive tests."""
         print(f"\nRunning Mobile/Responsive Tests (Browser: {browser})")
         
+        html_path, json_path = _report_paths("mobile")
         cmd = [
             "pytest",
             "tests/mobile/test_performance_responsive.py",
             f"--browser={browser}",
             "-m", "mobile",
-            "--html=reports/html/mobile-report.html",
+            f"--html={html_path}",
             "--self-contained-html",
             "--json-report",
-            "--json-report-file=reports/json/mobile-report.json",
+            f"--json-report-file={json_path}",
             "--headless",
             "-v"
         ]
         
-        result = self._execute_pytest_command(cmd, "mobile")
-        self.results["test_results"]["mobile"] = result
+        result = self._execute_pytest_command(cmd, "mobile", json_report_path=json_path)
+        self._record_result("mobile", result)
         
         return result
     
@@ -181,20 +482,21 @@ class TestExecutor:
         """Run smoke tests for quick validation."""
         print(f"\nRunning Smoke Tests (Browser: {browser})")
         
+        html_path, json_path = _report_paths("smoke")
         cmd = [
             "pytest",
             "-m", "smoke",
             f"--browser={browser}",
-            "--html=reports/html/smoke-report.html",
+            f"--html={html_path}",
             "--self-contained-html",
             "--json-report",
-            "--json-report-file=reports/json/smoke-report.json",
+            f"--json-report-file={json_path}",
             "--headless",
             "-v"
         ]
         
-        result = self._execute_pytest_command(cmd, "smoke")
-        self.results["test_results"]["smoke"] = result
+        result = self._execute_pytest_command(cmd, "smoke", json_report_path=json_path)
+        self._record_result("smoke", result)
         
         return result
     
@@ -202,22 +504,23 @@ class TestExecutor:
         """Run popup-specific functionality tests."""
         print(f"\nRunning Popup Tests (Browser: {browser})")
         
+        html_path, json_path = _report_paths("popup")
         cmd = [
             "pytest",
             "tests/popup/",
             f"--browser={browser}",
-            "--html=reports/html/popup-report.html",
+            f"--html={html_path}",
             "--self-contained-html",
             "--json-report",
-            "--json-report-file=reports/json/popup-report.json",
+            f"--json-report-file={json_path}",
             "-v"
         ]
         
         if headless:
             cmd.append("--headless")
         
-        result = self._execute_pytest_command(cmd, "popup")
-        self.results["test_results"]["popup"] = result
+        result = self._execute_pytest_command(cmd, "popup", json_report_path=json_path)
+        self._record_result("popup", result)
         
         return result
     
@@ -225,22 +528,23 @@ class TestExecutor:
         """Run unit tests for individual components."""
         print(f"\nRunning Unit Tests (Browser: {browser})")
         
+        html_path, json_path = _report_paths("unit")
         cmd = [
             "pytest",
             "tests/unit/",
             f"--browser={browser}",
-            "--html=reports/html/unit-report.html",
+            f"--html={html_path}",
             "--self-contained-html",
             "--json-report",
-            "--json-report-file=reports/json/unit-report.json",
+            f"--json-report-file={json_path}",
             "-v"
         ]
         
         if headless:
             cmd.append("--headless")
         
-        result = self._execute_pytest_command(cmd, "unit")
-        self.results["test_results"]["unit"] = result
+        result = self._execute_pytest_command(cmd, "unit", json_report_path=json_path)
+        self._record_result("unit", result)
         
         return result
     
@@ -248,22 +552,23 @@ class TestExecutor:
         """Run integration tests for component interactions."""
         print(f"\nRunning Integration Tests (Browser: {browser})")
         
+        html_path, json_path = _report_paths("integration")
         cmd = [
             "pytest",
             "tests/integration/",
             f"--browser={browser}",
-            "--html=reports/html/integration-report.html",
+            f"--html={html_path}",
             "--self-contained-html",
             "--json-report",
-            "--json-report-file=reports/json/integration-report.json",
+            f"--json-report-file={json_path}",
             "-v"
         ]
         
         if headless:
             cmd.append("--headless")
         
-        result = self._execute_pytest_command(cmd, "integration")
-        self.results["test_results"]["integration"] = result
+        result = self._execute_pytest_command(cmd, "integration", json_report_path=json_path)
+        self._record_result("integration", result)
         
         return result
     
@@ -271,39 +576,102 @@ class TestExecutor:
         """Run complete regression test suite."""
         print(f"\nRunning Full Regression Suite (Browser: {browser})")
         
-        # Run all test categories
-        results = {}
+        # Run all test categories in one pytest session
+        results = self.run_batched_suites(["critical", "performance", "mobile", "cross_browser"], browser)
+        
+        self._record_result("regression", results)
+        return results
+    
+    def run_batched_suites(self, markers, browser="chrome"):
+        """
+        Run several marker-selected suites in a single pytest invocation.
+        Collection, conftest and session fixtures are set up once; the results
+        are then split back into one entry per marker.
+        """
+        print(f"\nRunning Batched Suites: {', '.join(markers)} (Browser: {browser})")
+        
+        json_path = "reports/json/batched.json"
+        cmd = [
+            "pytest",
+            *dict.fromkeys(_BATCHED_SUITE_MODULES.get(marker, "tests/") for marker in markers),
+            f"--browser={browser}",
+            "-m", " or ".join(markers),
+            "--html=reports/html/batched-report.html",
+            "--self-contained-html",
+            "--json-report",
+            f"--json-report-file={json_path}",
+            "--headless",
+            "-v"
+        ]
         
-        results["critical"] = self.run_critical_tests(browser)
-        results["performance"] = self.run_performance_tests(browser)
-        results["mobile"] = self.run_mobile_tests(browser)
-        results["cross_browser"] = self.run_cross_browser_tests([browser])
+        batched = self._execute_pytest_command(cmd, "batched", json_report_path=json_path)
+        # Output, return code and timing once for the whole run; the tests go to the per-marker entries
+        self._record_result("batched", {
+            key: value for key, value in batched.items() if key not in ("summary", "tests", "tests_report")
+        })
+        
+        results = {}
+        for marker in markers:
+            result = self._split_result_by_marker(batched, marker)
+            # Keep the per-browser layout run_cross_browser_tests reports
+            results[marker] = {browser: result} if marker == "cross_browser" else result
+            self._record_result(marker, results[marker])
         
-        self.results["test_results"]["regression"] = results
         return results
     
-    def _execute_pytest_command(self, cmd, test_type):
-        """Execute pytest command and capture results."""
+    @staticmethod
+    def _split_result_by_marker(batched, marker):
+        """
+        Build a single suite's result from a batched run, keeping the tests from the
+        suite's own module that carry the marker. Run-wide data such as the output,
+        return code and execution time stays with the batched run.
+        """
+        module = _BATCHED_SUITE_MODULES.get(marker, "")
+        
+        def in_suite(test):
+            return test.get("nodeid", "").startswith(module) and marker in _test_markers(test)
+        
+        if "tests" in batched:
+            tests = [test for test in batched["tests"] if in_suite(test)]
+            result = {"tests": tests}
+        elif "tests_report" in batched:
+            # Large report: stream the tests and keep only the reference
+            tests = (test for test in _iter_report_tests(batched["tests_report"]) if in_suite(test))
+            result = {"tests_report": batched["tests_report"]}
+        else:
+            # No report to split; all that is known is whether the whole run passed
+            return {"success": batched.get("success", False)}
+        outcomes = Counter(test.get("outcome") for test in tests)
+        summary = dict(outcomes, total=sum(outcomes.values()))
+        result["summary"] = summary
+        result["success"] = not (summary.get("failed") or summary.get("error"))
+        return result
+    
+    def _record_result(self, suite_name, result):
+        """Store a suite's results; safe to call from concurrently running suites."""
+        with self._results_lock:
+            self.results["test_results"][suite_name] = result
+    
+    def _execute_pytest_command(self, cmd, test_type, json_report_path=None):
+        """Execute pytest command and capture results, loading the JSON report written to json_report_path."""
+        cmd = cmd + self._parallel_args()
         print(f"   Executing: {' '.join(cmd)}")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=1800  # 30 minutes timeout
-            )
-            
-            execution_time = time.time() - start_time
+            # Always in a child process, so a hung run can be killed after PYTEST_TIMEOUT
+            if cmd[0] == "pytest":
+                result = _run_pytest_in_process(cmd, PYTEST_TIMEOUT)
+            else:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=PYTEST_TIMEOUT
+                )
             
-            # Parse JSON report if available
-            json_report_path = None
-            for arg in cmd:
-                if arg.startswith("--json-report-file="):
-                    json_report_path = arg.split("=", 1)[1]
-                    break
+            execution_time = time.monotonic() - start_time
             
             test_results = {
                 "return_code": result.returncode,
@@ -316,10 +684,7 @@ class TestExecutor:
             # Load JSON report if available
             if json_report_path and os.path.exists(json_report_path):
                 try:
-                    with open(json_report_path, 'r') as f:
-                        json_data = json.load(f)
-                        test_results["summary"] = json_data.get("summary", {})
-                        test_results["tests"] = json_data.get("tests", [])
+                    test_results.update(_load_json_report(json_report_path))
                 except Exception as e:
                     print(f"   Could not parse JSON report: {e}")
             
@@ -340,10 +705,10 @@ class TestExecutor:
             return test_results
             
         except subprocess.TimeoutExpired:
-            print(f"   Test execution timed out after 30 minutes")
+            print(f"   Test execution timed out after {PYTEST_TIMEOUT // 60} minutes")
             return {
                 "return_code": -1,
-                "execution_time": 1800,
+                "execution_time": PYTEST_TIMEOUT,
                 "error": "Timeout",
                 "success": False
             }
@@ -360,8 +725,9 @@ class TestExecutor:
         """Generate comprehensive test execution report."""
         print("\nGenerating Comprehensive Report...")
         
-        end_time = datetime.now()
-        total_execution_time = (end_time - self.start_time).total_seconds()
+        end_time = self._now = datetime.now()
+        self._report_timestamp = end_time.strftime('%Y%m%d_%H%M%S')
+        total_execution_time = time.monotonic() - self._start_monotonic
         
         self.results["execution_info"]["end_time"] = end_time.isoformat()
         self.results["execution_info"]["total_execution_time"] = round(total_execution_time, 2)
@@ -379,9 +745,12 @@ class TestExecutor:
         self.results["production_readiness_assessment"] = readiness_assessment
         
         # Save comprehensive report
-        report_path = f"reports/comprehensive_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        report_path = f"reports/comprehensive_test_report_{self._report_timestamp}.json"
+        if orjson is not None:
+            Path(report_path).write_bytes(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(self.results, f, indent=2)
         
         # Generate HTML summary
         html_report_path = self._generate_html_summary()
@@ -487,123 +856,30 @@ class TestExecutor:
     
     def _generate_html_summary(self):
         """Generate HTML summary report."""
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Insider Test Automation - Execution Summary</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .header {{ text-align: center; margin-bottom: 30px; }}
-                .status-not-ready {{ color: #d32f2f; font-weight: bold; font-size: 24px; }}
-                .section {{ margin: 20px 0; padding: 15px; border-left: 4px solid #2196F3; background: #f8f9fa; }}
-                .critical {{ border-left-color: #f44336; }}
-                .warning {{ border-left-color: #ff9800; }}
-                .success {{ border-left-color: #4caf50; }}
-                .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 20px 0; }}
-                .stat-card {{ background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); text-align: center; }}
-                .bug-list {{ list-style: none; padding: 0; }}
-                .bug-item {{ background: #ffebee; margin: 5px 0; padding: 10px; border-radius: 4px; border-left: 4px solid #f44336; }}
-                table {{ width: 100%; border-collapse: collapse; margin: 15px 0; }}
-                th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-                th {{ background-color: #f5f5f5; font-weight: bold; }}
-                .footer {{ text-align: center; margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>Insider Test Automation Report</h1>
-                    <p><strong>Onsite Experiment Pop-up Campaign</strong></p>
-                    <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                    <div class="status-not-ready">PRODUCTION STATUS: NOT READY</div>
-                </div>
-                
-                <div class="section critical">
-                    <h2>Manual vs Automated Test Comparison</h2>
-                    <div class="stats-grid">
-                        <div class="stat-card">
-                            <h3>Manual Testing</h3>
-                            <p><strong>Success Rate: 22.9%</strong></p>
-                            <p>8/35 tests passed</p>
-                        </div>
-                        <div class="stat-card">
-                            <h3>Automated Validation</h3>
-                            <p><strong>Bug Reproduction: Expected</strong></p>
-                            <p>Critical bugs confirmed</p>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section critical">
-                    <h2>Critical Production Blockers</h2>
-                    <ul class="bug-list">
-                        <li class="bug-item"><strong>BUG001:</strong> URL parameter dependency - System unusable</li>
-                        <li class="bug-item"><strong>BUG002:</strong> Add to Cart not working - Revenue impact</li>
-                        <li class="bug-item"><strong>BUG004:</strong> Mobile 0% functionality - 60%+ users affected</li>
-                        <li class="bug-item"><strong>BUG005:</strong> Firefox/Safari failure - 40%+ browsers affected</li>
-                        <li class="bug-item"><strong>BUG007:</strong> 90% incorrect product mapping - Customer confusion</li>
-                    </ul>
-                </div>
-                
-                <div class="section warning">
-                    <h2>High Priority Issues</h2>
-                    <ul>
-                        <li><strong>BUG006:</strong> Performance 4.49s delay (>2s standard)</li>
-                        <li><strong>BUG008:</strong> Close buttons not working</li>
-                        <li><strong>BUG009:</strong> Memory leak detected</li>
-                        <li><strong>BUG010:</strong> Background overlay missing</li>
-                    </ul>
-                </div>
-                
-                <div class="section">
-                    <h2>Minimum Requirements for Production</h2>
-                    <table>
-                        <tr><th>Requirement</th><th>Current Status</th><th>Target</th></tr>
-                        <tr><td>Add to Cart Functionality</td><td>Broken</td><td>100% Working</td></tr>
-                        <tr><td>Mobile Compatibility</td><td>0% Functional</td><td>>95% Functional</td></tr>
-                        <tr><td>Cross-Browser Support</td><td>Chrome Only (Partial)</td><td>Chrome, Firefox, Safari</td></tr>
-                        <tr><td>Performance</td><td>4.49s Load Time</td><td><2s Load Time</td></tr>
-                        <tr><td>Content Accuracy</td><td>10% Correct</td><td>>95% Correct</td></tr>
-                    </table>
-                </div>
-                
-                <div class="section">
-                    <h2>Recommendations</h2>
-                    <ol>
-                        <li><strong>Immediate Action:</strong> Stop any production deployment plans</li>
-                        <li><strong>Critical Fixes:</strong> Address all P1 bugs (BUG001, BUG002, BUG004, BUG005, BUG007)</li>
-                        <li><strong>Cross-Browser Testing:</strong> Implement comprehensive browser compatibility</li>
-                        <li><strong>Mobile Development:</strong> Complete responsive design implementation</li>
-                        <li><strong>Performance Optimization:</strong> Reduce load times to <2 seconds</li>
-                        <li><strong>Content Validation:</strong> Fix product mapping accuracy to >95%</li>
-                    </ol>
-                </div>
-                
-                <div class="section">
-                    <h2>Estimated Timeline</h2>
-                    <p><strong>Production Readiness:</strong> 6-8 weeks with dedicated development team</p>
-                    <ul>
-                        <li><strong>Week 1-2:</strong> Critical bug fixes (BUG001, BUG002, BUG007)</li>
-                        <li><strong>Week 3-4:</strong> Cross-browser compatibility (BUG005)</li>
-                        <li><strong>Week 5-6:</strong> Mobile responsiveness (BUG004)</li>
-                        <li><strong>Week 7-8:</strong> Performance optimization and final testing</li>
-                    </ul>
-                </div>
-                
-                <div class="footer">
-                    <p>This report is based on comprehensive manual testing findings and automated validation.</p>
-                    <p><strong>Conclusion:</strong> The system is not suitable for production deployment in its current state.</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        html_path = f"reports/test_execution_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        parts = []
+        suite_results = self.results.get("overall_statistics", {}).get("suite_results", {})
+        if suite_results:
+            parts.append(
+                '        <div class="section">\n'
+                '            <h2>Automated Suite Results</h2>\n'
+                '            <table>\n'
+                '                <tr><th>Suite</th><th>Passed</th><th>Failed</th><th>Total</th><th>Success Rate</th></tr>\n'
+            )
+            for suite_name, stats in suite_results.items():
+                parts.append(
+                    f'                <tr><td>{html.escape(suite_name)}</td><td>{stats["passed"]}</td>'
+                    f'<td>{stats["failed"]}</td><td>{stats["total"]}</td><td>{stats["success_rate"]}%</td></tr>\n'
+                )
+            parts.append('            </table>\n        </div>\n')
+        
+        now = self._now or datetime.now()
+        html_content = _HTML_TEMPLATE.substitute(
+            timestamp=now.strftime('%Y-%m-%d %H:%M:%S'),
+            suite_results="".join(parts),
+        )
+        
+        html_path = f"reports/test_execution_summary_{self._report_timestamp or now.strftime('%Y%m%d_%H%M%S')}.html"
+        Path(html_path).write_text(html_content, encoding='utf-8')
         
         return html_path
     
@@ -650,10 +926,12 @@ def main():
     parser.add_argument("--browser", choices=["chrome", "firefox", "safari"], default="chrome", help="Browser to use")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
     parser.add_argument("--report-only", action="store_true", help="Generate report without running tests")
+    parser.add_argument("--workers", default="auto",
+                       help="pytest-xdist workers per suite: a number, or 'auto' for one per CPU (0 runs serially)")
     
     args = parser.parse_args()
     
-    executor = TestExecutor()
+    executor = TestExecutor(workers=args.workers)
     
     if not args.report_only:
         # Setup environment
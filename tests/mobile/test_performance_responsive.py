@@ -49,16 +49,16 @@ class TestPerformanceAndResponsive:
                     time.sleep(2)
                 
                 # Measure popup load time
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 
                 trigger_success = self.popup_page.click_show_instantly_button()
                 
                 if trigger_success:
                     popup_appeared = self.popup_page.wait_for_popup_to_appear(timeout=10)
-                    end_time = time.time()
+                    end_time = time.perf_counter_ns()
                     
                     if popup_appeared:
-                        load_time = end_time - start_time
+                        load_time = (end_time - start_time) / 1e9
                         performance_results.append(load_time)
                         
                         # Close popup for next attempt
@@ -131,15 +131,15 @@ class TestPerformanceAndResponsive:
                     time.sleep(1)
                 
                 # Measure just the open animation time
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 
                 if self.popup_page.click_show_instantly_button():
                     # Wait for popup to become visible (not just present)
                     popup_visible = self.popup_page.is_popup_visible(timeout=5)
-                    end_time = time.time()
+                    end_time = time.perf_counter_ns()
                     
                     if popup_visible:
-                        open_time = end_time - start_time
+                        open_time = (end_time - start_time) / 1e9
                         open_times.append(open_time)
                         
                         # Close for next attempt
@@ -0,0 +1,6 @@
+"""
+Unit tests package.
+
+This package contains tests for individual components that run
+without a browser session.
+"""
@@ -0,0 +1,70 @@
+"""
+Unit tests for the batched suite result split in run_tests.py.
+These tests work on plain report dictionaries and need no browser.
+"""
+
+import pytest
+import sys
+import os
+
+# Fix import path for direct script execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import run_tests
+
+POPUP_MODULE = "tests/popup/test_popup_functionality.py"
+MOBILE_MODULE = "tests/mobile/test_performance_responsive.py"
+
+
+def _test_entry(module, name, markers, outcome):
+    """A pytest-json-report test entry, with the markers conftest.py records."""
+    return {
+        "nodeid": f"{module}::TestSuite::{name}",
+        # Keywords also carry directory names, e.g. "mobile" for everything under tests/mobile/
+        "keywords": [name, *markers, "mobile", "tests"],
+        "metadata": {"markers": markers},
+        "outcome": outcome,
+    }
+
+
+@pytest.fixture
+def batched():
+    return {
+        "return_code": 1,
+        "execution_time": 42.0,
+        "stdout": "full -v log",
+        "stderr": "",
+        "success": False,
+        "summary": {"passed": 3, "failed": 1, "total": 4},
+        "tests": [
+            _test_entry(POPUP_MODULE, "test_tc001", ["critical", "smoke"], "passed"),
+            _test_entry(POPUP_MODULE, "test_tc004", ["performance"], "passed"),
+            _test_entry(MOBILE_MODULE, "test_tc004", ["performance"], "passed"),
+            _test_entry(MOBILE_MODULE, "test_tc010", ["mobile", "critical"], "failed"),
+        ],
+    }
+
+
+class TestSplitResultByMarker:
+    """Checks that a batched run is split the way the separate suite runs counted tests."""
+
+    def test_keeps_only_suite_module_tests_with_the_marker(self, batched):
+        critical = run_tests.TestExecutor._split_result_by_marker(batched, "critical")
+        assert [test["nodeid"] for test in critical["tests"]] == [f"{POPUP_MODULE}::TestSuite::test_tc001"]
+        assert critical["summary"] == {"passed": 1, "total": 1}
+        assert critical["success"] is True
+
+    def test_directory_keyword_is_not_a_marker(self, batched):
+        mobile = run_tests.TestExecutor._split_result_by_marker(batched, "mobile")
+        assert [test["nodeid"] for test in mobile["tests"]] == [f"{MOBILE_MODULE}::TestSuite::test_tc010"]
+        assert mobile["summary"] == {"failed": 1, "total": 1}
+        assert mobile["success"] is False
+
+    def test_run_wide_data_is_not_copied(self, batched):
+        performance = run_tests.TestExecutor._split_result_by_marker(batched, "performance")
+        assert set(performance) == {"tests", "summary", "success"}
+        assert performance["summary"] == {"passed": 1, "total": 1}
+
+    def test_missing_report_keeps_only_run_success(self, batched):
+        for key in ("summary", "tests"):
+            del batched[key]
+        assert run_tests.TestExecutor._split_result_by_marker(batched, "critical") == {"success": False}
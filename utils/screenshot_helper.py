@@ -3,13 +3,66 @@ Screenshot Helper for Insider Test Automation Project
 Handles automatic screenshot capture for test documentation and failure analysis.
 """
 
+import atexit
+import io
 import os
+import queue
+import threading
 import time
 import logging
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 
 
+# JPEG quality for error screenshots; roughly 10x smaller than PNG and still readable
+ERROR_JPEG_QUALITY = 70
+
+# Base directories whose subfolders have already been created in this process
+_initialized_dirs = set()
+
+# Background writer so screenshot calls return without waiting on disk
+_write_queue = queue.Queue()
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+
+def _writer_loop():
+    """Write queued (path, png_bytes, jpeg_quality) items to disk, re-encoding as JPEG when a quality is set."""
+    logger = logging.getLogger("ScreenshotHelper")
+    while True:
+        path, data, jpeg_quality = _write_queue.get()
+        try:
+            if jpeg_quality:
+                image = Image.open(io.BytesIO(data)).convert("RGB")
+                image.save(path, format="JPEG", quality=jpeg_quality, optimize=True)
+            else:
+                with open(path, "wb") as f:
+                    f.write(data)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to write screenshot {path}: {str(e)}")
+        finally:
+            _write_queue.task_done()
+
+
+def _enqueue_write(path, data, jpeg_quality=None):
+    """Queue a screenshot for the writer thread, starting it on first use."""
+    global _writer_thread
+    if _writer_thread is None:
+        with _writer_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(target=_writer_loop, name="screenshot-helper-writer", daemon=True)
+                _writer_thread.start()
+    _write_queue.put((path, data, jpeg_quality))
+
+
+def flush_screenshots():
+    """Block until every queued screenshot has been written to disk."""
+    _write_queue.join()
+
+
+atexit.register(flush_screenshots)
+
+
 class ScreenshotHelper:
     """Helper class for managing screenshots during test execution."""
     
@@ -35,7 +88,9 @@ class ScreenshotHelper:
         self._create_directories()
     
     def _create_directories(self):
-        """Create screenshot directories if they don't exist."""
+        """Create screenshot directories if they don't exist (once per base directory)."""
+        if self.base_dir in _initialized_dirs:
+            return
         directories = [
             self.base_dir, 
             self.failed_dir, 
@@ -45,6 +100,7 @@ class ScreenshotHelper:
         ]
         for directory in directories:
             os.makedirs(directory, exist_ok=True)
+        _initialized_dirs.add(self.base_dir)
     
     def take_screenshot(self, test_name, status="evidence", description=""):
         """
@@ -77,22 +133,27 @@ class ScreenshotHelper:
             directory = self.evidence_dir
             prefix = "EVIDENCE"
         
+        # Error screenshots are stored as JPEG, everything else as PNG
+        extension = "jpg" if status == "error" else "png"
+        
         # Create filename
         if description:
             clean_description = self._clean_filename(description)
-            filename = f"{prefix}_{clean_test_name}_{clean_description}_{timestamp}.png"
+            filename = f"{prefix}_{clean_test_name}_{clean_description}_{timestamp}.{extension}"
         else:
-            filename = f"{prefix}_{clean_test_name}_{timestamp}.png"
+            filename = f"{prefix}_{clean_test_name}_{timestamp}.{extension}"
         
         filepath = os.path.join(directory, filename)
         
         try:
-            # Take screenshot
-            self.driver.save_screenshot(filepath)
-            
-            # Add metadata to screenshot if needed
             if status == "failed":
+                # The failure overlay edits the saved file, so write it synchronously
+                self.driver.save_screenshot(filepath)
                 self._add_failure_metadata(filepath, test_name, description)
+            else:
+                # Capture now, encode and write on the background thread
+                jpeg_quality = ERROR_JPEG_QUALITY if status == "error" else None
+                _enqueue_write(filepath, self.driver.get_screenshot_as_png(), jpeg_quality)
             
             self.logger.info(f"Screenshot saved: {filepath}")
             return filepath
@@ -349,6 +410,8 @@ class ScreenshotHelper:
             Path to the HTML report
         """
         report_path = os.path.join(self.base_dir, "screenshot_report.html")
+        # Make sure queued screenshots exist before linking them
+        flush_screenshots()
         
         html_content = """
         <!DOCTYPE html>
@@ -537,7 +600,7 @@ class ScreenshotHelper:
         
         for root, dirs, files in os.walk(self.base_dir):
             for file in files:
-                if file.endswith('.png'):
+                if file.endswith(('.png', '.jpg')):
                     file_path = os.path.join(root, file)
                     if os.path.getmtime(file_path) < cutoff_time:
                         try:
@@ -567,7 +630,7 @@ class ScreenshotHelper:
         
         for root, dirs, files in os.walk(self.base_dir):
             for file in files:
-                if file.endswith('.png'):
+                if file.endswith(('.png', '.jpg')):
                     file_path = os.path.join(root, file)
                     stats['total'] += 1
                     